@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-from graph_builder import GraphBuilder
+from flask_compress import Compress
+from graph_builder import GraphBuilder, LazyPathDetails
+from json_provider import ORJSONProvider
 from data_fetcher import CzechRegistryFetcher, ISIRFetcher, InternationalRegistryFetcher
 from or_parser import or_parser
+import functools
 import json
 import logging
 import os
@@ -11,7 +14,9 @@ import time
 from logging.handlers import TimedRotatingFileHandler
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)  # Enable CORS for frontend
+Compress(app)  # gzip/brotli for large subgraph payloads
 
 # --- Error Logging ---
 _start_time = time.time()
@@ -40,6 +45,56 @@ intl_fetcher = InternationalRegistryFetcher()
 # Configuration: Set to True to download real OR data, False for sample data
 USE_REAL_DATA = True  # Set via environment variable or change here
 
+# --- Path query cache ---
+# Path computation dominates /api/shortest-path and /api/top-paths, and the UI
+# re-issues identical queries (e.g. when toggling filters), so results are
+# memoized. Keys include graph_builder.version, so any mutation invalidates
+# them even without clear_path_cache(). Top-K results are keyed per filter
+# combination since the search itself applies the filters. lru_cache is
+# thread-safe, so lookups take no lock; misses on different queries run in
+# parallel.
+
+@functools.lru_cache(maxsize=4096)
+def _cached_shortest(version, source_id, target_id):
+    path = graph_builder.find_shortest_path(source_id, target_id)
+    return tuple(path) if path else None
+
+@functools.lru_cache(maxsize=4096)
+def _cached_top_k(version, source_id, target_id, k, exclude_insolvent=False,
+                  exclude_foreign=False, exclude_inactive=False):
+    return tuple(tuple(path) for path in graph_builder.find_top_k_paths(
+        source_id, target_id, k, exclude_insolvent, exclude_foreign, exclude_inactive
+    ))
+
+def _no_paths_message(source_id, target_id, filters):
+    """Explain an empty top-K result: blame the filters only if an unfiltered path exists"""
+    if any(filters) and _cached_shortest(graph_builder.version, source_id, target_id) is not None:
+        return "No paths found matching your filter criteria"
+    return f"No paths found between {source_id} and {target_id}"
+
+def clear_path_cache():
+    """Drop memoized path results (call whenever the graph changes)"""
+    _cached_shortest.cache_clear()
+    _cached_top_k.cache_clear()
+    graph_builder.clear_caches()
+
+# Minimal dataset loaded when or_parser cannot provide one
+_FALLBACK_ENTITIES = (
+    {"id": "00012345", "name": "ABC s.r.o.", "type": "company"},
+    {"id": "00067891", "name": "XYZ a.s.", "type": "company"},
+    {"id": "RC123456", "name": "Jan Novák", "type": "person"},
+    {"id": "RC789012", "name": "Petr Svoboda", "type": "person"},
+    {"id": "00054321", "name": "DEF s.r.o.", "type": "company"},
+)
+
+_FALLBACK_RELATIONSHIPS = (
+    ("RC123456", "00012345", "jednatel"),
+    ("00012345", "00067891", "společník"),
+    ("RC789012", "00067891", "jednatel"),
+    ("RC123456", "00054321", "společník"),
+    ("00054321", "RC789012", "vlastník"),
+)
+
 # Sample data for testing (will be replaced with real data)
 def load_sample_data():
     """Load sample Czech business registry data"""
@@ -72,23 +127,18 @@ def load_sample_data():
             print(f"Loading {len(real_data['companies'])} companies into graph...")
             
             # Add companies to graph
-            for i, company in enumerate(real_data['companies']):
+            for company in real_data['companies']:
                 graph_builder.add_entity(company['id'], company)
-                if i < 5:  # Print first 5
-                    print(f"  Added: {company['name']} ({company['id']})")
             
             # Add relationships if any
             print(f"Loading {len(real_data.get('relationships', []))} relationships...")
-            for i, rel in enumerate(real_data.get('relationships', [])):
+            for rel in real_data.get('relationships', []):
                 graph_builder.add_relationship(
                     rel['source'],
                     rel['target'],
                     rel['type'],
                     metadata={'active': rel.get('active', True)}
                 )
-                if i < 5:  # Print first 5
-                    active_status = "active" if rel.get('active', True) else "inactive"
-                    print(f"  Added: {rel['source']} --[{rel['type']} ({active_status})]--> {rel['target']}")
             
             stats = graph_builder.get_graph_stats()
             print("=" * 50)
@@ -96,6 +146,7 @@ def load_sample_data():
             print(f"  Total nodes: {stats['total_nodes']}")
             print(f"  Total edges: {stats['total_edges']}")
             print("=" * 50)
+            graph_builder.finalize()
             return
             
     except ImportError as e:
@@ -110,28 +161,14 @@ def load_sample_data():
     
     # Fallback: Sample entities
     print("Loading fallback sample data...")
-    entities = [
-        {"id": "00012345", "name": "ABC s.r.o.", "type": "company"},
-        {"id": "00067891", "name": "XYZ a.s.", "type": "company"},
-        {"id": "RC123456", "name": "Jan Novák", "type": "person"},
-        {"id": "RC789012", "name": "Petr Svoboda", "type": "person"},
-        {"id": "00054321", "name": "DEF s.r.o.", "type": "company"},
-    ]
-    
-    for entity in entities:
+    # add_entity only reads the dicts, so the shared constants are passed as-is
+    for entity in _FALLBACK_ENTITIES:
         graph_builder.add_entity(entity["id"], entity)
     
-    relationships = [
-        ("RC123456", "00012345", "jednatel"),
-        ("00012345", "00067891", "společník"),
-        ("RC789012", "00067891", "jednatel"),
-        ("RC123456", "00054321", "společník"),
-        ("00054321", "RC789012", "vlastník"),
-    ]
-    
-    for source, target, rel_type in relationships:
+    for source, target, rel_type in _FALLBACK_RELATIONSHIPS:
         graph_builder.add_relationship(source, target, rel_type)
     
+    graph_builder.finalize()
     print("Sample data loaded (fallback)")
 
 
@@ -158,43 +195,23 @@ def search_entities():
     if not query:
         return jsonify({"error": "Query parameter 'q' is required"}), 400
     
+    # Matches come back already ordered: name prefix matches first, then by name
     results = []
-    seen_ids = set()
-    
-    print(f"Searching for: {query}")
-    print(f"Total nodes in graph: {graph_builder.graph.number_of_nodes()}")
-    
-    for node_id in graph_builder.graph.nodes():
-        node_data = graph_builder.graph.nodes[node_id]
-        name = str(node_data.get('name', '')).lower()
-        city = str(node_data.get('city', '')).lower()
-        node_id_lower = str(node_id).lower()
-        
-        # Search by name, ID, or city
-        if query in name or query in node_id_lower or query in city:
-            if node_id not in seen_ids:
-                entity_type = node_data.get('type', 'unknown')
-                
-                result = {
-                    'id': node_id,
-                    'name': node_data.get('name', 'Unknown'),
-                    'type': entity_type,
-                    'city': node_data.get('city', ''),
-                    'insolvent': node_data.get('insolvent', False),
-                    'country': node_data.get('country', 'CZ')
-                }
-                results.append(result)
-                seen_ids.add(node_id)
-                print(f"Found match: {result['name']} ({node_id})")
-    
-    # Sort results: exact matches first, then by name
-    results.sort(key=lambda x: (
-        not x['name'].lower().startswith(query),  # Exact matches first
-        x['name'].lower()
-    ))
-    
-    print(f"Returning {len(results)} results")
-    return jsonify({"results": results[:20]})  # Limit to 20 results
+    nodes_view = graph_builder.graph.nodes
+    for node_id in graph_builder.search_index.search(query, limit=20):
+        node_data = nodes_view[node_id]
+        result = {
+            'id': node_id,
+            'name': node_data.get('name', 'Unknown'),
+            'type': node_data.get('type', 'unknown'),
+            'city': node_data.get('city', ''),
+            'insolvent': node_data.get('insolvent', False),
+            'country': node_data.get('country', 'CZ')
+        }
+        results.append(result)
+
+    app.logger.debug("Search %r: %d results", query, len(results))
+    return jsonify({"results": results})
 
 @app.route('/api/shortest-path', methods=['POST'])
 def find_shortest_path():
@@ -208,7 +225,7 @@ def find_shortest_path():
         return jsonify({"error": "Both 'source' and 'target' are required"}), 400
     
     # Find shortest path
-    path = graph_builder.find_shortest_path(source_id, target_id)
+    path = _cached_shortest(graph_builder.version, source_id, target_id)
     
     if not path:
         return jsonify({
@@ -241,84 +258,115 @@ def find_top_paths():
     exclude_insolvent = data.get('exclude_insolvent', False)
     exclude_foreign = data.get('exclude_foreign', False)
     exclude_inactive = data.get('exclude_inactive', False)
+    limit = data.get('limit')
+    offset = data.get('offset', 0)
 
     if not source_id or not target_id:
         return jsonify({"error": "Both 'source' and 'target' are required"}), 400
 
-    # Find top K paths
-    paths = graph_builder.find_top_k_paths(source_id, target_id, k)
+    if limit is not None and not (isinstance(limit, int) and limit > 0
+                                  and isinstance(offset, int) and offset >= 0):
+        return jsonify({"error": "'limit' must be a positive integer and 'offset' a non-negative integer"}), 400
 
-    if not paths:
-        return jsonify({
-            "found": False,
-            "message": f"No paths found between {source_id} and {target_id}"
-        })
+    # Find top K paths on the view with excluded entities / relationships removed
+    filters = (bool(exclude_insolvent), bool(exclude_foreign), bool(exclude_inactive))
+    filtered_paths = _cached_top_k(graph_builder.version, source_id, target_id, k, *filters)
 
-    # Filter paths based on criteria
-    filtered_paths = []
-    for path in paths:
-        path_valid = True
-
-        # Check each node in path
-        for node_id in path:
-            node_data = graph_builder.graph.nodes[node_id]
-
-            # Skip insolvent entities if filter is on
-            if exclude_insolvent and node_data.get('insolvent', False):
-                path_valid = False
-                break
-
-            # Skip foreign entities if filter is on
-            if exclude_foreign and node_data.get('country', 'CZ') != 'CZ':
-                path_valid = False
-                break
-
-        # Check edges in path for inactive relationships
-        if path_valid and exclude_inactive:
-            for i in range(len(path) - 1):
-                edge_data = graph_builder.graph.edges[path[i], path[i + 1]]
-                if not edge_data.get('active', True):
-                    path_valid = False
-                    break
-
-        if path_valid:
-            filtered_paths.append(path)
-    
     if not filtered_paths:
         return jsonify({
             "found": False,
-            "message": "No paths found matching your filter criteria"
-        })
-    
-    # Get details for each path
-    paths_with_details = []
-    for path in filtered_paths:
-        paths_with_details.append({
-            "path": path,
-            "length": len(path) - 1,
-            "details": graph_builder.get_path_details(path)
+            "message": _no_paths_message(source_id, target_id, filters)
         })
     
-    # Export subgraph with all paths
+    # Details are computed only for the paths actually returned
+    path_details = LazyPathDetails(filtered_paths, graph_builder)
+    if limit is None:
+        page = range(len(path_details))
+    else:
+        page = range(offset, min(offset + limit, len(path_details)))
+    paths_with_details = [path_details[i] for i in page]
+
+    # Export subgraph with all returned paths
     all_nodes = set()
-    for path in filtered_paths:
-        all_nodes.update(path)
+    for entry in paths_with_details:
+        all_nodes.update(entry["path"])
     
     subgraph = graph_builder.export_subgraph(list(all_nodes), depth=0)
     
-    # Add insolvent and country info to subgraph nodes
-    for node in subgraph['nodes']:
-        node_id = node['data']['id']
-        node_data = graph_builder.graph.nodes[node_id]
-        node['data']['insolvent'] = node_data.get('insolvent', False)
-        node['data']['country'] = node_data.get('country', 'CZ')
-    
-    return jsonify({
+    response = {
         "found": True,
         "count": len(filtered_paths),
         "paths": paths_with_details,
         "subgraph": subgraph
-    })
+    }
+    if limit is not None:
+        response["next_offset"] = page.stop if page.stop < len(path_details) else None
+
+    return jsonify(response)
+
+MAX_BATCH_QUERIES = 100
+
+def _run_path_query(query: dict) -> dict:
+    """Answer one /api/paths/batch query (no subgraph export)"""
+    source_id = query.get('source')
+    target_id = query.get('target')
+    if not source_id or not target_id:
+        return {"error": "Both 'source' and 'target' are required"}
+
+    k = query.get('k')
+    if k is None and query.get('distance_only'):
+        distance = graph_builder.find_shortest_distance(source_id, target_id)
+        if distance is None:
+            return {"found": False, "message": f"No path found between {source_id} and {target_id}"}
+        return {"found": True, "distance": distance}
+
+    if k is None:
+        path = _cached_shortest(graph_builder.version, source_id, target_id)
+        if not path:
+            return {"found": False, "message": f"No path found between {source_id} and {target_id}"}
+        return {
+            "found": True,
+            "path": path,
+            "path_length": len(path) - 1,
+            "details": graph_builder.get_path_details(path)
+        }
+
+    filters = (bool(query.get('exclude_insolvent', False)),
+               bool(query.get('exclude_foreign', False)),
+               bool(query.get('exclude_inactive', False)))
+    filtered_paths = _cached_top_k(graph_builder.version, source_id, target_id, k, *filters)
+    if not filtered_paths:
+        return {"found": False, "message": _no_paths_message(source_id, target_id, filters)}
+    return {
+        "found": True,
+        "count": len(filtered_paths),
+        "paths": list(LazyPathDetails(filtered_paths, graph_builder).values())
+    }
+
+@app.route('/api/paths/batch', methods=['POST'])
+def find_paths_batch():
+    """Answer several shortest-path / top-K queries in one request"""
+    data = request.json
+    queries = data.get('queries') if isinstance(data, dict) else None
+
+    if not isinstance(queries, list) or not queries:
+        return jsonify({"error": "'queries' must be a non-empty list"}), 400
+    if len(queries) > MAX_BATCH_QUERIES:
+        return jsonify({"error": f"At most {MAX_BATCH_QUERIES} queries per batch"}), 400
+
+    # Identical queries within a batch are computed once
+    answers = {}
+    results = []
+    for query in queries:
+        if not isinstance(query, dict):
+            results.append({"error": "Each query must be an object"})
+            continue
+        key = json.dumps(query, sort_keys=True)
+        if key not in answers:
+            answers[key] = _run_path_query(query)
+        results.append(answers[key])
+
+    return jsonify({"results": results})
 
 @app.route('/api/multi-path', methods=['POST'])
 def find_multi_point_path():
@@ -343,29 +391,9 @@ def find_multi_point_path():
         })
 
     # Apply filters to the path
-    path_valid = True
-
-    # Check each node in path
-    for node_id in path:
-        node_data = graph_builder.graph.nodes[node_id]
-
-        # Skip insolvent entities if filter is on
-        if exclude_insolvent and node_data.get('insolvent', False):
-            path_valid = False
-            break
-
-        # Skip foreign entities if filter is on
-        if exclude_foreign and node_data.get('country', 'CZ') != 'CZ':
-            path_valid = False
-            break
-
-    # Check edges in path for inactive relationships
-    if path_valid and exclude_inactive:
-        for i in range(len(path) - 1):
-            edge_data = graph_builder.graph.edges[path[i], path[i + 1]]
-            if not edge_data.get('active', True):
-                path_valid = False
-                break
+    path_valid = bool(graph_builder.filter_paths(
+        [path], exclude_insolvent, exclude_foreign, exclude_inactive
+    ))
 
     if not path_valid:
         return jsonify({
@@ -379,13 +407,6 @@ def find_multi_point_path():
     # Export subgraph for visualization
     subgraph = graph_builder.export_subgraph(path, depth=1)
 
-    # Add insolvent and country info to subgraph nodes
-    for node in subgraph['nodes']:
-        node_id = node['data']['id']
-        node_data = graph_builder.graph.nodes[node_id]
-        node['data']['insolvent'] = node_data.get('insolvent', False)
-        node['data']['country'] = node_data.get('country', 'CZ')
-
     return jsonify({
         "found": True,
         "path": path,
@@ -395,20 +416,33 @@ def find_multi_point_path():
         "waypoints": waypoints
     })
 
+# Serialized /api/graph-stats body; (graph version, bytes) of the last request
+_stats_body = (-1, None)
+
+def _short_lived(response, max_age: int = 5):
+    """Let clients reuse a response for a few seconds"""
+    response.headers['Cache-Control'] = f'public, max-age={max_age}'
+    return response
+
 @app.route('/api/graph-stats', methods=['GET'])
 def get_graph_stats():
     """Get graph statistics"""
-    stats = graph_builder.get_graph_stats()
-    return jsonify(stats)
+    global _stats_body
+    version, body = _stats_body
+    if version != graph_builder.version:
+        version = graph_builder.version
+        body = app.json.response(graph_builder.get_graph_stats()).get_data()
+        _stats_body = (version, body)
+    return _short_lived(app.response_class(body, mimetype='application/json'))
 
 @app.route('/api/stats', methods=['GET'])
 def get_stats():
     """Get simplified stats for the frontend hero section"""
     stats = graph_builder.get_graph_stats()
-    return jsonify({
+    return _short_lived(jsonify({
         'entities': stats.get('total_nodes', 0),
         'relationships': stats.get('total_edges', 0)
-    })
+    }))
 
 @app.route('/api/explore/<entity_id>', methods=['GET'])
 def explore_entity(entity_id):
@@ -422,89 +456,102 @@ def explore_entity(entity_id):
         existing_nodes_param = request.args.get('existing_nodes', '')
         existing_nodes = set(existing_nodes_param.split(',')) if existing_nodes_param else set()
 
+        # delta=1: return only what the client does not have yet. Edges between
+        # two already-visible nodes are assumed to be on screen already.
+        delta = request.args.get('delta') == '1'
+        existing_used = []
+
         # Get the entity and its neighbors
-        node_data = graph_builder.graph.nodes[entity_id]
-        neighbors = list(graph_builder.graph.neighbors(entity_id))
+        nodes_view = graph_builder.graph.nodes
+        node_data = nodes_view[entity_id]
+        adjacent = graph_builder.adjacent_edges(entity_id)
+        neighbors = [neighbor_id for neighbor_id, _, _ in adjacent]
+        entity_visible = delta and entity_id in existing_nodes
 
         # Build nodes list
         nodes = []
         edges = []
 
         # Add the main entity
-        nodes.append({
-            'data': {
-                'id': entity_id,
-                'label': node_data.get('name', entity_id),
-                'type': node_data.get('type', 'unknown'),
-                'in_path': False,
-                'insolvent': node_data.get('insolvent', False),
-                'country': node_data.get('country', 'CZ'),
-                'city': node_data.get('city', '')
-            }
-        })
-
-        # Add neighbors
-        for neighbor_id in neighbors:
-            neighbor_data = graph_builder.graph.nodes[neighbor_id]
+        if not entity_visible:
             nodes.append({
                 'data': {
-                    'id': neighbor_id,
-                    'label': neighbor_data.get('name', neighbor_id),
-                    'type': neighbor_data.get('type', 'unknown'),
+                    'id': entity_id,
+                    'label': node_data.get('name', entity_id),
+                    'type': node_data.get('type', 'unknown'),
                     'in_path': False,
-                    'insolvent': neighbor_data.get('insolvent', False),
-                    'country': neighbor_data.get('country', 'CZ'),
-                    'city': neighbor_data.get('city', '')
+                    'insolvent': node_data.get('insolvent', False),
+                    'country': node_data.get('country', 'CZ'),
+                    'city': node_data.get('city', '')
                 }
             })
 
+        # Add neighbors
+        for neighbor_id, edge_type, edge_active in adjacent:
+            if delta and neighbor_id in existing_nodes:
+                existing_used.append(neighbor_id)
+                if entity_visible:
+                    continue
+            else:
+                neighbor_data = nodes_view[neighbor_id]
+                nodes.append({
+                    'data': {
+                        'id': neighbor_id,
+                        'label': neighbor_data.get('name', neighbor_id),
+                        'type': neighbor_data.get('type', 'unknown'),
+                        'in_path': False,
+                        'insolvent': neighbor_data.get('insolvent', False),
+                        'country': neighbor_data.get('country', 'CZ'),
+                        'city': neighbor_data.get('city', '')
+                    }
+                })
+
             # Add edge from entity to neighbor
-            edge_data = graph_builder.graph.edges[entity_id, neighbor_id]
             edges.append({
                 'data': {
                     'source': entity_id,
                     'target': neighbor_id,
-                    'type': edge_data.get('type', 'unknown'),
-                    'active': edge_data.get('active', True),
+                    'type': edge_type,
+                    'active': edge_active,
                     'in_path': False
                 }
             })
 
-        # Add edges between neighbors and existing visible nodes
+        # Add edges between neighbors and existing visible nodes: one pass
+        # over each neighbor's adjacency with O(1) set membership tests
         if existing_nodes:
             for neighbor_id in neighbors:
-                for existing_node_id in existing_nodes:
-                    # Check if there's an edge between neighbor and existing node
-                    if existing_node_id in graph_builder.graph and graph_builder.graph.has_edge(neighbor_id, existing_node_id):
-                        edge_data = graph_builder.graph.edges[neighbor_id, existing_node_id]
+                if delta and neighbor_id in existing_nodes:
+                    continue
+                for other_id, edge_type, edge_active in graph_builder.adjacent_edges(neighbor_id):
+                    if other_id in existing_nodes and not (delta and other_id == entity_id):
                         edges.append({
                             'data': {
                                 'source': neighbor_id,
-                                'target': existing_node_id,
-                                'type': edge_data.get('type', 'unknown'),
-                                'active': edge_data.get('active', True),
-                                'in_path': False
-                            }
-                        })
-                    # Check reverse direction
-                    elif existing_node_id in graph_builder.graph and graph_builder.graph.has_edge(existing_node_id, neighbor_id):
-                        edge_data = graph_builder.graph.edges[existing_node_id, neighbor_id]
-                        edges.append({
-                            'data': {
-                                'source': existing_node_id,
-                                'target': neighbor_id,
-                                'type': edge_data.get('type', 'unknown'),
-                                'active': edge_data.get('active', True),
+                                'target': other_id,
+                                'type': edge_type,
+                                'active': edge_active,
                                 'in_path': False
                             }
                         })
 
+        entity = {
+            "id": entity_id,
+            "name": node_data.get('name', entity_id),
+            "type": node_data.get('type', 'unknown')
+        }
+
+        if delta:
+            return jsonify({
+                "entity": entity,
+                "added_nodes": nodes,
+                "added_edges": edges,
+                "existing_used": existing_used,
+                "neighbor_count": len(neighbors)
+            })
+
         return jsonify({
-            "entity": {
-                "id": entity_id,
-                "name": node_data.get('name', entity_id),
-                "type": node_data.get('type', 'unknown')
-            },
+            "entity": entity,
             "subgraph": {
                 "nodes": nodes,
                 "edges": edges
@@ -521,21 +568,21 @@ def get_entity_details(entity_id):
     if entity_id not in graph_builder.graph.nodes():
         return jsonify({"error": "Entity not found"}), 404
     
-    node_data = graph_builder.graph.nodes[entity_id]
+    nodes_view = graph_builder.graph.nodes
+    node_data = nodes_view[entity_id]
     
-    # Get neighbors
-    neighbors = list(graph_builder.graph.neighbors(entity_id))
+    # Neighbors with their relationship type, from the CSR slice when current
+    neighbors = graph_builder.adjacent_edges(entity_id)
     neighbor_details = []
     
-    for neighbor_id in neighbors:
-        neighbor_data = graph_builder.graph.nodes[neighbor_id]
-        edge_data = graph_builder.graph.edges[entity_id, neighbor_id]
+    for neighbor_id, rel_type, _ in neighbors:
+        neighbor_data = nodes_view[neighbor_id]
         
         neighbor_details.append({
             'id': neighbor_id,
             'name': neighbor_data.get('name', ''),
             'type': neighbor_data.get('type', ''),
-            'relationship': edge_data.get('type', '')
+            'relationship': rel_type
         })
     
     return jsonify({
@@ -549,7 +596,8 @@ def get_entity_details(entity_id):
 @app.route('/api/debug/reload', methods=['POST'])
 def debug_reload():
     """Debug endpoint to reload data"""
-    graph_builder.graph.clear()
+    graph_builder.clear()
+    clear_path_cache()
     load_sample_data()
     stats = graph_builder.get_graph_stats()
     return jsonify({
@@ -562,7 +610,8 @@ def enable_real_data():
     """Debug endpoint to enable real data loading"""
     import os
     os.environ['USE_REAL_DATA'] = 'true'
-    graph_builder.graph.clear()
+    graph_builder.clear()
+    clear_path_cache()
     load_sample_data()
     stats = graph_builder.get_graph_stats()
     return jsonify({
@@ -597,6 +646,7 @@ else:
     print(f"Graph already loaded with {graph_builder.graph.number_of_nodes()} nodes")
 
 if __name__ == '__main__':
+    # Local development only - production runs under gunicorn (see Procfile)
     import os
     port = int(os.environ.get('PORT', 5000))
-    app.run(debug=False, host='0.0.0.0', port=port)
+    app.run(debug=False, host='0.0.0.0', port=port, threaded=True)
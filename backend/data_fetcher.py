@@ -3,19 +3,41 @@ import requests
 import json
 from typing import Dict, List, Optional
 
+# Seconds to wait for a registry before giving up (connect and read)
+REQUEST_TIMEOUT = 5
+
 class CzechRegistryFetcher:
     """Fetches data from Czech Business Registry API"""
     
     def __init__(self):
         self.base_url = "https://dataor.justice.cz/api/3/action"
+        # Keep-alive connection pool reused across calls
+        self.session = requests.Session()
+        # (url, params) -> (ETag, parsed body) of the last successful response
+        self._response_cache: Dict[tuple, tuple] = {}
         
+    def _get_json(self, url: str, params: Optional[Dict] = None) -> Dict:
+        """GET a JSON document, revalidating a cached copy with its ETag"""
+        key = (url, tuple(sorted((params or {}).items())))
+        cached = self._response_cache.get(key)
+        headers = {'If-None-Match': cached[0]} if cached else {}
+
+        response = self.session.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
+        if cached and response.status_code == 304:
+            return cached[1]
+        response.raise_for_status()
+
+        data = response.json()
+        etag = response.headers.get('ETag')
+        if etag:
+            self._response_cache[key] = (etag, data)
+        return data
+
     def fetch_registry_data(self) -> Optional[Dict]:
         """Fetch complete registry dataset"""
         try:
             # Get package list
-            response = requests.get(f"{self.base_url}/package_list")
-            response.raise_for_status()
-            packages = response.json()
+            packages = self._get_json(f"{self.base_url}/package_list")
             
             if packages.get('success'):
                 # Get the latest package
@@ -30,12 +52,7 @@ class CzechRegistryFetcher:
     def fetch_package_data(self, package_name: str) -> Optional[Dict]:
         """Fetch specific package data"""
         try:
-            response = requests.get(
-                f"{self.base_url}/package_show",
-                params={'id': package_name}
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._get_json(f"{self.base_url}/package_show", params={'id': package_name})
         except Exception as e:
             print(f"Error fetching package {package_name}: {e}")
             return None
@@ -61,16 +78,19 @@ class InternationalRegistryFetcher:
     
     def __init__(self):
         self.opencorporates_url = "https://api.opencorporates.com/v0.4"
+        # Keep-alive connection pool reused across calls
+        self.session = requests.Session()
         
     def fetch_cyprus_data(self, company_name: str) -> Optional[Dict]:
         """Fetch Cyprus registry data via OpenCorporates"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.opencorporates_url}/companies/search",
                 params={
                     'q': company_name,
                     'jurisdiction_code': 'cy'
-                }
+                },
+                timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
             return response.json()
@@ -81,12 +101,13 @@ class InternationalRegistryFetcher:
     def fetch_netherlands_data(self, company_name: str) -> Optional[Dict]:
         """Fetch Netherlands registry data via OpenCorporates"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.opencorporates_url}/companies/search",
                 params={
                     'q': company_name,
                     'jurisdiction_code': 'nl'
-                }
+                },
+                timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
             return response.json()
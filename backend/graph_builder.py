@@ -1,25 +1,144 @@
 # -*- coding: utf-8 -*-
+import functools
+import itertools
+import logging
 import networkx as nx
+from array import array
+from collections.abc import Mapping
+from sys import intern
 from typing import List, Dict, Tuple, Optional
+import graph_kernels
+from search_index import SearchIndex
+
+logger = logging.getLogger(__name__)
+
+
+def _interned(value):
+    """sys.intern for strings; anything else is returned unchanged"""
+    return intern(value) if type(value) is str else value
+
+
+class LazyPathDetails(Mapping):
+    """Maps path index -> {'path', 'length', 'details'}, computed on first access"""
+
+    def __init__(self, paths: List[List[str]], graph_builder: 'GraphBuilder'):
+        self._paths = paths
+        self._graph_builder = graph_builder
+        self._computed: Dict[int, Dict] = {}
+
+    def __getitem__(self, i: int) -> Dict:
+        entry = self._computed.get(i)
+        if entry is None:
+            if not 0 <= i < len(self._paths):
+                raise KeyError(i)
+            path = self._paths[i]
+            entry = {
+                "path": path,
+                "length": len(path) - 1,
+                "details": self._graph_builder.get_path_details(path)
+            }
+            self._computed[i] = entry
+        return entry
+
+    def __iter__(self):
+        return iter(range(len(self._paths)))
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+
+class DisjointSet:
+    """Union-find over node IDs with a running component count"""
+
+    def __init__(self):
+        self.parent: Dict[str, str] = {}
+        self.size: Dict[str, int] = {}
+        self.num_components = 0
+
+    def add(self, item: str):
+        """Add item as its own component (no-op if already present)"""
+        if item not in self.parent:
+            self.parent[item] = item
+            self.size[item] = 1
+            self.num_components += 1
+
+    def find(self, item: str) -> str:
+        """Root of item's component, halving the path on the way"""
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: str, b: str):
+        """Merge the components of a and b (adding either if new)"""
+        self.add(a)
+        self.add(b)
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        self.num_components -= 1
+
 
 class GraphBuilder:
     """Builds and queries the relationship graph"""
     
     def __init__(self):
         self.graph = nx.Graph()
-        print(f"[GraphBuilder] New instance created - ID: {id(self)}")
+        # Bumped on every mutation so callers can cache derived data
+        self.version = 0
+        # Search index kept in sync by add_entity / add_relationship / clear
+        self.search_index = SearchIndex()
+        # Connected components, maintained by add_entity / add_relationship / clear
+        self.components = DisjointSet()
+        # (version, stats) of the last get_graph_stats() computation
+        self._stats_cache = (-1, None)
+        # Flat per-node attribute arrays (see rebuild_attr_arrays)
+        self.node_ids: List[str] = []
+        self.id_to_idx: Dict[str, int] = {}
+        self.insolvent_arr = bytearray()
+        self.country_cz_arr = bytearray()
+        self.inactive_edges = set()
+        self._excluded_node_sets: Dict[tuple, frozenset] = {}
+        self._excluded_node_masks: Dict[tuple, bytearray] = {}
+        self._filtered_views: Dict[tuple, nx.Graph] = {}
+        # self.version the attribute arrays were built at (-1: none / invalidated)
+        self._attr_version = -1
+        # Read-only CSR adjacency (see build_csr)
+        self.indptr = array('i', [0])
+        self.indices = array('i')
+        self.edge_type_ids = array('H')
+        # Interned relationship type vocabulary; edge_type_ids index into rel_types
+        self.rel_types: List[str] = []
+        self._rel_type_ids: Dict[str, int] = {}
+        self.edge_active = bytearray()
+        # self.version the CSR snapshot was built at (-1: none / invalidated)
+        self._csr_version = -1
+        # Per-instance memo for get_path_details, keyed by (path tuple, version)
+        self._path_details_cache = functools.lru_cache(maxsize=8192)(self._build_path_details)
+        # Multi-point segments, keyed by (endpoints in sorted order, version)
+        self._segment_cache = functools.lru_cache(maxsize=4096)(self._build_segment)
+        logger.debug("[GraphBuilder] New instance created - ID: %s", id(self))
         
     def add_entity(self, entity_id: str, entity_data: Dict):
         """Add entity (company or person) to graph"""
+        self.version += 1
         self.graph.add_node(
             entity_id,
             name=entity_data.get('name', ''),
-            type=entity_data.get('type', 'unknown'),
-            city=entity_data.get('city', ''),
-            country=entity_data.get('country', 'CZ'),
-            insolvent=entity_data.get('insolvent', False),
-            data=entity_data
+            # Small vocabularies repeated on every node: share one string each
+            type=_interned(entity_data.get('type', 'unknown')),
+            city=_interned(entity_data.get('city', '')),
+            country=_interned(entity_data.get('country', 'CZ')),
+            insolvent=entity_data.get('insolvent', False)
         )
+        self.search_index.add(entity_id, entity_data.get('name', ''), entity_data.get('city', ''))
+        self.components.add(entity_id)
     
     def add_relationship(self, entity1_id: str, entity2_id: str,
                         relationship_type: str, metadata: Dict = None):
@@ -27,6 +146,14 @@ class GraphBuilder:
         if metadata is None:
             metadata = {}
 
+        self.version += 1
+        # Endpoints not added via add_entity still have to be searchable
+        for entity_id in (entity1_id, entity2_id):
+            if entity_id not in self.graph:
+                self.search_index.add(entity_id)
+
+        # Store the canonical string so every edge of a type shares one object
+        relationship_type = self.rel_types[self.rel_type_id(relationship_type)]
         self.graph.add_edge(
             entity1_id,
             entity2_id,
@@ -34,11 +161,207 @@ class GraphBuilder:
             active=metadata.get('active', True),
             metadata=metadata
         )
+        self.components.union(entity1_id, entity2_id)
     
+    def finalize(self):
+        """Build the read-only query structures once loading is done.
+
+        NetworkX stays the write-side store; traversals and filters read the
+        flat per-node arrays and the CSR adjacency built here. Call again after
+        every bulk load - queries fall back to NetworkX while it is stale.
+        """
+        self.rebuild_attr_arrays()
+        self.build_csr()
+
+    def rebuild_attr_arrays(self):
+        """Snapshot the path filter attributes into flat arrays and sets.
+
+        Path filters then test one byte per node instead of walking the
+        NetworkX attribute dicts. The snapshot is stamped with self.version;
+        see _attrs_current().
+        """
+        nodes = self.graph.nodes
+        self.node_ids = list(nodes)
+        self.id_to_idx = {node_id: i for i, node_id in enumerate(self.node_ids)}
+        self.insolvent_arr = bytearray(bool(nodes[n].get('insolvent', False)) for n in self.node_ids)
+        self.country_cz_arr = bytearray(nodes[n].get('country', 'CZ') == 'CZ' for n in self.node_ids)
+        self._excluded_node_sets = {}
+        self._excluded_node_masks = {}
+        self._filtered_views = {}
+
+        # Inactive relationships, stored in both orientations
+        self.inactive_edges = set()
+        for u, v, active in self.graph.edges(data='active', default=True):
+            if not active:
+                self.inactive_edges.add((u, v))
+                self.inactive_edges.add((v, u))
+        self._attr_version = self.version
+
+    def _attrs_current(self) -> bool:
+        """True if no mutation happened since rebuild_attr_arrays()"""
+        return self._attr_version == self.version
+
+    def build_csr(self):
+        """Snapshot the adjacency into compressed sparse row arrays.
+
+        Neighbors of node index u are indices[indptr[u]:indptr[u + 1]], in the
+        same order NetworkX yields them; edge_type_ids / edge_active are aligned
+        with indices. Node indices come from the attribute arrays, which are
+        rebuilt first if stale.
+        """
+        if not self._attrs_current():
+            self.rebuild_attr_arrays()
+        id_to_idx = self.id_to_idx
+        indptr = array('i', [0])
+        indices = array('i')
+        edge_type_ids = array('H')
+        edge_active = bytearray()
+        rel_type_id = self.rel_type_id
+
+        adj = self.graph.adj
+        for node_id in self.node_ids:
+            for neighbor_id, edge_data in adj[node_id].items():
+                indices.append(id_to_idx[neighbor_id])
+                edge_type_ids.append(rel_type_id(edge_data.get('type', 'unknown')))
+                edge_active.append(bool(edge_data.get('active', True)))
+            indptr.append(len(indices))
+
+        self.indptr = indptr
+        self.indices = indices
+        self.edge_type_ids = edge_type_ids
+        self.edge_active = edge_active
+        self._csr_version = self.version
+
+    def rel_type_id(self, relationship_type: str) -> int:
+        """Code of a relationship type, adding it to the vocabulary on first use"""
+        type_id = self._rel_type_ids.get(relationship_type)
+        if type_id is None:
+            type_id = len(self.rel_types)
+            self.rel_types.append(relationship_type)
+            self._rel_type_ids[relationship_type] = type_id
+        return type_id
+
+    def adjacent_edges(self, node_id: str) -> List[Tuple[str, str, bool]]:
+        """(neighbor_id, relationship type, active) for every edge of a node.
+
+        Served from the CSR slice while the snapshot is current, otherwise
+        from the NetworkX adjacency.
+        """
+        idx = self.idx(node_id)
+        if idx is not None:
+            node_ids = self.node_ids
+            indices = self.indices
+            rel_types = self.rel_types
+            edge_type_ids = self.edge_type_ids
+            edge_active = self.edge_active
+            return [
+                (node_ids[indices[slot]], rel_types[edge_type_ids[slot]], bool(edge_active[slot]))
+                for slot in range(self.indptr[idx], self.indptr[idx + 1])
+            ]
+
+        return [
+            (neighbor_id, edge_data.get('type', 'unknown'), edge_data.get('active', True))
+            for neighbor_id, edge_data in self.graph.adj[node_id].items()
+        ]
+
+    def _excluded_nodes(self, exclude_insolvent: bool, exclude_foreign: bool) -> frozenset:
+        """Node IDs removed by a filter combination, built once per load"""
+        if not self._attrs_current():
+            # Stale arrays: read the live attributes, don't cache
+            return frozenset(
+                node_id for node_id, data in self.graph.nodes(data=True)
+                if (exclude_insolvent and data.get('insolvent', False))
+                or (exclude_foreign and data.get('country', 'CZ') != 'CZ')
+            )
+        key = (bool(exclude_insolvent), bool(exclude_foreign))
+        excluded = self._excluded_node_sets.get(key)
+        if excluded is None:
+            excluded = frozenset(
+                node_id for i, node_id in enumerate(self.node_ids)
+                if (exclude_insolvent and self.insolvent_arr[i])
+                or (exclude_foreign and not self.country_cz_arr[i])
+            )
+            self._excluded_node_sets[key] = excluded
+        return excluded
+
+    def _excluded_mask(self, exclude_insolvent: bool, exclude_foreign: bool) -> bytearray:
+        """Per-node-index mask (1 = excluded) for a filter combination, built once per load"""
+        key = (bool(exclude_insolvent), bool(exclude_foreign))
+        mask = self._excluded_node_masks.get(key)
+        if mask is None:
+            mask = bytearray(len(self.node_ids))
+            if exclude_insolvent:
+                mask = bytearray(a | b for a, b in zip(mask, self.insolvent_arr))
+            if exclude_foreign:
+                mask = bytearray(a | (not b) for a, b in zip(mask, self.country_cz_arr))
+            self._excluded_node_masks[key] = mask
+        return mask
+
+    def _inactive_edges(self) -> set:
+        """Inactive relationships in both orientations"""
+        if self._attrs_current():
+            return self.inactive_edges
+        inactive = set()
+        for u, v, active in self.graph.edges(data='active', default=True):
+            if not active:
+                inactive.add((u, v))
+                inactive.add((v, u))
+        return inactive
+
+    def filter_paths(self, paths: List[List[str]], exclude_insolvent: bool = False,
+                     exclude_foreign: bool = False, exclude_inactive: bool = False) -> List[List[str]]:
+        """Drop paths through insolvent / foreign entities or inactive relationships.
+
+        The filter flags are resolved into one frozen set of excluded node IDs
+        up front; each path is then checked with set.isdisjoint, which runs
+        the per-node loop in C.
+        """
+        check_nodes = exclude_insolvent or exclude_foreign
+        if not (check_nodes or exclude_inactive):
+            return list(paths)
+
+        excluded = self._excluded_nodes(exclude_insolvent, exclude_foreign) if check_nodes else None
+        inactive = self._inactive_edges() if exclude_inactive else None
+
+        filtered = []
+        for path in paths:
+            if excluded and not excluded.isdisjoint(path):
+                continue
+            if inactive and not inactive.isdisjoint(zip(path, path[1:])):
+                continue
+            filtered.append(path)
+        return filtered
+
+    def _csr_is_current(self) -> bool:
+        """True if no mutation happened since the CSR snapshot was built"""
+        return self._csr_version == self.version
+
+    def idx(self, node_id: str) -> Optional[int]:
+        """CSR index of a node, or None if it is unknown or the snapshot is stale"""
+        idx = self.id_to_idx.get(node_id)
+        if idx is None or not self._csr_is_current():
+            return None
+        return idx
+
+    def ids(self, indices) -> List[str]:
+        """Node IDs for a sequence of CSR indices"""
+        node_ids = self.node_ids
+        return [node_ids[i] for i in indices]
+
     def find_shortest_path(self, source_id: str, target_id: str) -> Optional[List[str]]:
         """Find shortest path between two entities"""
+        src = self.idx(source_id)
+        tgt = self.idx(target_id)
+        if src is not None and tgt is not None:
+            path = graph_kernels.bfs_path(self.indptr, self.indices, src, tgt)
+            if path is None:
+                print(f"No path found between {source_id} and {target_id}")
+                return None
+            return self.ids(path)
+
+        # Unknown IDs or a stale snapshot: let NetworkX handle it
         try:
-            return nx.shortest_path(self.graph, source=source_id, target=target_id)
+            return nx.bidirectional_shortest_path(self.graph, source_id, target_id)
         except nx.NetworkXNoPath:
             print(f"No path found between {source_id} and {target_id}")
             return None
@@ -46,11 +369,78 @@ class GraphBuilder:
             print(f"Node not found: {e}")
             return None
     
-    def find_top_k_paths(self, source_id: str, target_id: str, k: int = 3) -> List[List[str]]:
-        """Find top k shortest paths between two entities"""
+    def find_shortest_distance(self, source_id: str, target_id: str) -> Optional[int]:
+        """Number of relationships on the shortest path, or None if unreachable"""
+        src = self.idx(source_id)
+        tgt = self.idx(target_id)
+        if src is not None and tgt is not None:
+            return graph_kernels.bfs_distance(self.indptr, self.indices, src, tgt)
+
         try:
-            paths = list(nx.shortest_simple_paths(self.graph, source=source_id, target=target_id))
-            return paths[:k]
+            return nx.shortest_path_length(self.graph, source=source_id, target=target_id)
+        except (nx.NetworkXNoPath, nx.NodeNotFound):
+            return None
+
+    def filtered_view(self, exclude_insolvent: bool = False, exclude_foreign: bool = False,
+                      exclude_inactive: bool = False) -> nx.Graph:
+        """Read-only view of the graph without the excluded nodes / relationships.
+
+        One view per filter combination (at most 8), reused until the next
+        rebuild_attr_arrays(). While the attribute arrays are stale the view
+        is built from the live graph and not cached.
+        """
+        key = (bool(exclude_insolvent), bool(exclude_foreign), bool(exclude_inactive))
+        if key == (False, False, False):
+            return self.graph
+
+        cacheable = self._attrs_current()
+        view = self._filtered_views.get(key) if cacheable else None
+        if view is None:
+            filter_node = nx.filters.no_filter
+            filter_edge = nx.filters.no_filter
+            if exclude_insolvent or exclude_foreign:
+                excluded = self._excluded_nodes(exclude_insolvent, exclude_foreign)
+
+                def filter_node(node_id):
+                    return node_id not in excluded
+
+            if exclude_inactive:
+                inactive = self._inactive_edges()
+
+                def filter_edge(u, v):
+                    return (u, v) not in inactive
+
+            view = nx.subgraph_view(self.graph, filter_node=filter_node, filter_edge=filter_edge)
+            if cacheable:
+                self._filtered_views[key] = view
+        return view
+
+    def find_top_k_paths(self, source_id: str, target_id: str, k: int = 3,
+                         exclude_insolvent: bool = False, exclude_foreign: bool = False,
+                         exclude_inactive: bool = False) -> List[List[str]]:
+        """Find top k shortest paths between two entities, optionally without filtered nodes / edges.
+
+        Runs Yen's algorithm on the CSR snapshot, with the filters applied as
+        node / edge masks. Falls back to NetworkX on a filtered view while the
+        snapshot is stale.
+        """
+        src = self.idx(source_id)
+        tgt = self.idx(target_id)
+        if src is not None and tgt is not None:
+            blocked = self._excluded_mask(exclude_insolvent, exclude_foreign)
+            edge_ok = self.edge_active if exclude_inactive else None
+            paths = graph_kernels.k_shortest_paths(self.indptr, self.indices, src, tgt, k,
+                                                   blocked, edge_ok)
+            if not paths:
+                print(f"No path found between {source_id} and {target_id}")
+            return [self.ids(path) for path in paths]
+
+        graph = self.filtered_view(exclude_insolvent, exclude_foreign, exclude_inactive)
+        try:
+            # shortest_simple_paths is a generator; only the first k are computed
+            return list(itertools.islice(
+                nx.shortest_simple_paths(graph, source=source_id, target=target_id), k
+            ))
         except nx.NetworkXNoPath:
             print(f"No path found between {source_id} and {target_id}")
             return []
@@ -71,30 +461,46 @@ class GraphBuilder:
             source = waypoints[i]
             target = waypoints[i + 1]
 
-            try:
-                segment = nx.shortest_path(self.graph, source=source, target=target)
-
-                # Add segment to combined path, avoiding duplicates at connection points
-                if i == 0:
-                    combined_path.extend(segment)
-                else:
-                    # Skip first node of segment (it's the last node of previous segment)
-                    combined_path.extend(segment[1:])
-
-            except nx.NetworkXNoPath:
-                print(f"No path found between {source} and {target}")
-                return None
-            except nx.NodeNotFound as e:
-                print(f"Node not found: {e}")
+            # Undirected graph: A -> B and B -> A share one cached search
+            if str(source) <= str(target):
+                segment = self._segment_cache(source, target, self.version)
+            else:
+                segment = self._segment_cache(target, source, self.version)
+                segment = segment[::-1] if segment is not None else None
+            if segment is None:
                 return None
 
+            # Add segment to combined path, avoiding duplicates at connection points
+            if i == 0:
+                combined_path.extend(segment)
+            else:
+                # Skip first node of segment (it's the last node of previous segment)
+                combined_path.extend(segment[1:])
+
         return combined_path
     
+    def _build_segment(self, source: str, target: str, version: int) -> Optional[Tuple[str, ...]]:
+        """Uncached multi-point segment (version only keys the cache)"""
+        path = self.find_shortest_path(source, target)
+        return tuple(path) if path is not None else None
+
     def get_path_details(self, path: List[str]) -> List[Dict]:
-        """Get detailed information about entities in a path"""
+        """Get detailed information about entities in a path (memoized, treat as read-only)"""
+        return self._path_details_cache(tuple(path), self.version)
+
+    def clear_caches(self):
+        """Drop memoized query results (call whenever the graph changes)"""
+        self._path_details_cache.cache_clear()
+        self._segment_cache.cache_clear()
+
+    def _build_path_details(self, path: Tuple[str, ...], version: int) -> List[Dict]:
+        """Uncached get_path_details (version only keys the cache)"""
+        nodes = self.graph.nodes
+        adj = self.graph.adj
+        last = len(path) - 1
         details = []
         for i, node_id in enumerate(path):
-            node_data = self.graph.nodes[node_id]
+            node_data = nodes[node_id]
             detail = {
                 'id': node_id,
                 'name': node_data.get('name', ''),
@@ -103,8 +509,8 @@ class GraphBuilder:
             }
             
             # Add edge info if not last node
-            if i < len(path) - 1:
-                edge_data = self.graph.edges[node_id, path[i + 1]]
+            if i < last:
+                edge_data = adj[node_id][path[i + 1]]
                 detail['relationship_to_next'] = edge_data.get('type', '')
             
             details.append(detail)
@@ -112,62 +518,116 @@ class GraphBuilder:
         return details
     
     def get_graph_stats(self) -> Dict:
-        """Get statistics about the graph"""
-        return {
-            'total_nodes': self.graph.number_of_nodes(),
-            'total_edges': self.graph.number_of_edges(),
-            'is_connected': nx.is_connected(self.graph) if len(self.graph) > 0 else False
-        }
+        """Get statistics about the graph (recomputed only after a mutation; don't modify the result)"""
+        version, stats = self._stats_cache
+        if version != self.version:
+            stats = {
+                'total_nodes': self.graph.number_of_nodes(),
+                'total_edges': self.graph.number_of_edges(),
+                'is_connected': self.components.num_components == 1
+            }
+            self._stats_cache = (self.version, stats)
+        return stats
     
     def export_subgraph(self, path: List[str], depth: int = 1) -> Dict:
         """Export subgraph around a path for visualization"""
-        # Get all nodes in path plus their neighbors up to depth
-        nodes_to_include = set(path)
-        
-        for node in path:
-            neighbors = nx.single_source_shortest_path_length(
-                self.graph, node, cutoff=depth
+        path_set = set(path)
+        id_to_idx = self.id_to_idx
+
+        if self._csr_is_current() and all(node_id in id_to_idx for node_id in path_set):
+            # One multi-source BFS from every path node instead of one per node
+            node_ids = self.node_ids
+            indptr = self.indptr
+            indices = self.indices
+            reached = graph_kernels.multi_source_bfs(
+                indptr, indices, [id_to_idx[node_id] for node_id in path_set], depth
             )
-            nodes_to_include.update(neighbors.keys())
-        
-        # Create subgraph
-        subgraph = self.graph.subgraph(nodes_to_include)
-        
-        # Convert to format suitable for Cytoscape.js
-        nodes = []
-        edges = []
-        
-        for node_id in subgraph.nodes():
-            node_data = subgraph.nodes[node_id]
-            nodes.append({
+            # in_path per node index, so edges test two bytes instead of hashing IDs
+            on_path = bytearray(len(node_ids))
+            for node_id in path_set:
+                on_path[id_to_idx[node_id]] = 1
+            rel_types = self.rel_types
+            edge_type_ids = self.edge_type_ids
+            edge_active = self.edge_active
+            subgraph_nodes = [node_ids[i] for i, d in enumerate(reached) if d >= 0]
+            subgraph_edges = [
+                (node_ids[u], node_ids[indices[slot]], rel_types[edge_type_ids[slot]], bool(edge_active[slot]),
+                 bool(on_path[u] and on_path[indices[slot]]))
+                for u, d in enumerate(reached) if d >= 0
+                for slot in range(indptr[u], indptr[u + 1])
+                # Each undirected edge once, from its lower endpoint
+                if indices[slot] >= u and reached[indices[slot]] >= 0
+            ]
+        else:
+            # Path nodes plus their neighbors up to depth, in one shared-frontier BFS
+            adj = self.graph.adj
+            nodes_to_include = set(path)
+            frontier = set(nodes_to_include)
+            for _ in range(depth):
+                next_level = set()
+                for u in frontier:
+                    # Set difference over the adjacency keys runs in C
+                    next_level |= adj[u].keys() - nodes_to_include
+                nodes_to_include |= next_level
+                frontier = next_level
+
+            # Stream the induced edges from the adjacency, no subgraph view; an
+            # edge is emitted from whichever endpoint is visited first
+            subgraph_nodes = list(nodes_to_include)
+            subgraph_edges = []
+            visited = set()
+            for source in subgraph_nodes:
+                for target, edge_data in adj[source].items():
+                    if target in nodes_to_include and target not in visited:
+                        subgraph_edges.append((
+                            source, target, edge_data.get('type', 'unknown'), edge_data.get('active', True),
+                            source in path_set and target in path_set
+                        ))
+                visited.add(source)
+
+        # Convert to format suitable for Cytoscape.js, one pass per list
+        graph_nodes = self.graph.nodes
+        nodes = [
+            {
                 'data': {
                     'id': node_id,
                     'label': node_data.get('name', node_id),
                     'type': node_data.get('type', 'unknown'),
-                    'in_path': node_id in path,
+                    'in_path': node_id in path_set,
                     'insolvent': node_data.get('insolvent', False),
                     'country': node_data.get('country', 'CZ'),
                     'city': node_data.get('city', '')
                 }
-            })
-        
-        for edge in subgraph.edges():
-            edge_data = subgraph.edges[edge]
-            edges.append({
+            }
+            for node_id, node_data in zip(subgraph_nodes, map(graph_nodes.__getitem__, subgraph_nodes))
+        ]
+
+        edges = [
+            {
                 'data': {
-                    'source': edge[0],
-                    'target': edge[1],
-                    'type': edge_data.get('type', 'unknown'),
-                    'active': edge_data.get('active', True),
-                    'in_path': edge[0] in path and edge[1] in path
+                    'source': source,
+                    'target': target,
+                    'type': edge_type,
+                    'active': active,
+                    'in_path': in_path
                 }
-            })
-        
+            }
+            for source, target, edge_type, active, in_path in subgraph_edges
+        ]
+
         return {'nodes': nodes, 'edges': edges}
 
     def clear(self):
         """Clear the graph"""
-        import traceback
-        print(f"[GraphBuilder] GRAPH CLEARED! Stack trace:")
-        traceback.print_stack()
-        self.graph.clear()
\ No newline at end of file
+        # The stack is only walked when DEBUG logging is enabled
+        logger.debug("[GraphBuilder] GRAPH CLEARED! Stack trace:", stack_info=True)
+        self.graph.clear()
+        self.version += 1
+        self._csr_version = -1
+        self._attr_version = -1
+        self._excluded_node_sets = {}
+        self._excluded_node_masks = {}
+        self._filtered_views = {}
+        self.search_index.clear()
+        self.components = DisjointSet()
+        self.clear_caches()
\ No newline at end of file
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+# Traversal kernels over CSR adjacency arrays: neighbors of node index u are
+# indices[indptr[u]:indptr[u + 1]]. They only see flat int arrays - GraphBuilder
+# maps node IDs in and out.
+import heapq
+from array import array
+from typing import List, Optional, Tuple
+
+
+def bidirectional_bfs(indptr, indices, src: int, tgt: int) -> Optional[Tuple[array, array, int]]:
+    """Bidirectional BFS from src and tgt.
+
+    Expands whichever frontier is smaller, one level at a time, and returns
+    (pred, succ, meet) the moment a scanned node is already in the other
+    search tree - mid-level, without finishing the level. pred / succ hold the
+    parent towards src / tgt (-1 = unvisited, roots point to themselves).
+    None if the two nodes are not connected.
+    """
+    pred = array('i', [-1]) * (len(indptr) - 1)
+    succ = array('i', [-1]) * (len(indptr) - 1)
+    pred[src] = src
+    succ[tgt] = tgt
+    if src == tgt:
+        return pred, succ, src
+
+    forward = [src]
+    reverse = [tgt]
+
+    while forward and reverse:
+        if len(forward) <= len(reverse):
+            this_level, forward = forward, []
+            for u in this_level:
+                for v in indices[indptr[u]:indptr[u + 1]]:
+                    if pred[v] == -1:
+                        pred[v] = u
+                        forward.append(v)
+                    if succ[v] != -1:
+                        return pred, succ, v
+        else:
+            this_level, reverse = reverse, []
+            for u in this_level:
+                for v in indices[indptr[u]:indptr[u + 1]]:
+                    if succ[v] == -1:
+                        succ[v] = u
+                        reverse.append(v)
+                    if pred[v] != -1:
+                        return pred, succ, v
+
+    return None
+
+
+def bfs_path(indptr, indices, src: int, tgt: int) -> Optional[List[int]]:
+    """Shortest path src -> tgt as node indices, or None"""
+    found = bidirectional_bfs(indptr, indices, src, tgt)
+    if found is None:
+        return None
+
+    pred, succ, meet = found
+    path = [meet]
+    v = meet
+    while pred[v] != v:
+        v = pred[v]
+        path.append(v)
+    path.reverse()
+    v = meet
+    while succ[v] != v:
+        v = succ[v]
+        path.append(v)
+    return path
+
+
+def bfs_distance(indptr, indices, src: int, tgt: int) -> Optional[int]:
+    """Hop count src -> tgt without materializing the path, or None"""
+    found = bidirectional_bfs(indptr, indices, src, tgt)
+    if found is None:
+        return None
+
+    pred, succ, meet = found
+    hops = 0
+    v = meet
+    while pred[v] != v:
+        v = pred[v]
+        hops += 1
+    v = meet
+    while succ[v] != v:
+        v = succ[v]
+        hops += 1
+    return hops
+
+
+def constrained_bfs_path(indptr, indices, src: int, tgt: int, blocked: bytearray,
+                         blocked_edges: Optional[set] = None,
+                         edge_ok: Optional[bytearray] = None) -> Optional[List[int]]:
+    """Shortest path src -> tgt avoiding blocked nodes / edges, or None.
+
+    blocked is a per-node mask (1 = unusable), blocked_edges a set of (u, v)
+    index pairs, edge_ok an optional per-slot mask (0 = unusable). src must
+    not be blocked. Same level-by-level bidirectional scheme as
+    bidirectional_bfs, with the extra checks on every scanned slot.
+    """
+    if blocked[src] or blocked[tgt]:
+        return None
+    if src == tgt:
+        return [src]
+
+    pred = array('i', [-1]) * (len(indptr) - 1)
+    succ = array('i', [-1]) * (len(indptr) - 1)
+    pred[src] = src
+    succ[tgt] = tgt
+    forward = [src]
+    reverse = [tgt]
+    meet = -1
+
+    while forward and reverse and meet == -1:
+        if len(forward) <= len(reverse):
+            this_level, forward = forward, []
+            tree, other, frontier = pred, succ, forward
+        else:
+            this_level, reverse = reverse, []
+            tree, other, frontier = succ, pred, reverse
+
+        for u in this_level:
+            for slot in range(indptr[u], indptr[u + 1]):
+                v = indices[slot]
+                if blocked[v] or (edge_ok is not None and not edge_ok[slot]) \
+                        or (blocked_edges and (u, v) in blocked_edges):
+                    continue
+                if tree[v] == -1:
+                    tree[v] = u
+                    frontier.append(v)
+                if other[v] != -1:
+                    meet = v
+                    break
+            if meet != -1:
+                break
+
+    if meet == -1:
+        return None
+
+    path = [meet]
+    v = meet
+    while pred[v] != v:
+        v = pred[v]
+        path.append(v)
+    path.reverse()
+    v = meet
+    while succ[v] != v:
+        v = succ[v]
+        path.append(v)
+    return path
+
+
+def k_shortest_paths(indptr, indices, src: int, tgt: int, k: int,
+                     blocked: Optional[bytearray] = None,
+                     edge_ok: Optional[bytearray] = None) -> List[List[int]]:
+    """Yen's algorithm: up to k loopless paths src -> tgt in order of length.
+
+    blocked / edge_ok restrict the graph as in constrained_bfs_path. Spur
+    searches block root-path nodes and already used deviation edges through a
+    copied node mask and an edge set instead of copying the graph.
+    """
+    base = blocked if blocked is not None else bytearray(len(indptr) - 1)
+    first = constrained_bfs_path(indptr, indices, src, tgt, base, None, edge_ok)
+    if first is None or k < 1:
+        return []
+
+    found = [first]
+    seen = {tuple(first)}
+    candidates = []
+    counter = 0
+
+    while len(found) < k:
+        prev = found[-1]
+        for i in range(len(prev) - 1):
+            root = prev[:i + 1]
+            spur = prev[i]
+
+            # Don't re-use an edge that an earlier path took from this root
+            blocked_edges = set()
+            for path in found:
+                if len(path) > i + 1 and path[:i + 1] == root:
+                    blocked_edges.add((path[i], path[i + 1]))
+                    blocked_edges.add((path[i + 1], path[i]))
+
+            # Root nodes (except the spur node) must not be revisited
+            spur_blocked = bytearray(base)
+            for node in root[:-1]:
+                spur_blocked[node] = 1
+
+            spur_path = constrained_bfs_path(indptr, indices, spur, tgt, spur_blocked,
+                                             blocked_edges, edge_ok)
+            if spur_path is None:
+                continue
+
+            candidate = root[:-1] + spur_path
+            key = tuple(candidate)
+            if key not in seen:
+                seen.add(key)
+                heapq.heappush(candidates, (len(candidate), counter, candidate))
+                counter += 1
+
+        if not candidates:
+            break
+        found.append(heapq.heappop(candidates)[2])
+
+    return found
+
+
+def multi_source_bfs(indptr, indices, sources: List[int], cutoff: int) -> array:
+    """Hop distance from the nearest of sources, up to cutoff.
+
+    One level-synchronous sweep from all sources at once; returns a per-node
+    array with -1 for nodes further than cutoff (or unreachable).
+    """
+    depth = array('i', [-1]) * (len(indptr) - 1)
+    frontier = []
+    for s in sources:
+        if depth[s] == -1:
+            depth[s] = 0
+            frontier.append(s)
+
+    level = 0
+    while frontier and level < cutoff:
+        level += 1
+        next_level = []
+        for u in frontier:
+            for v in indices[indptr[u]:indptr[u + 1]]:
+                if depth[v] == -1:
+                    depth[v] = level
+                    next_level.append(v)
+        frontier = next_level
+    return depth
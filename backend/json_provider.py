@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (used by jsonify and request.json)"""
+
+    # Keep Flask's key order and let its default() handle datetimes (HTTP date format)
+    option = orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def dumps(self, obj, **kwargs) -> str:
+        """Serialize to a JSON string; explicit json.dumps options use the stdlib"""
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self.option).decode('utf-8')
+
+    def response(self, *args, **kwargs):
+        """jsonify(): serialize straight to bytes.
+
+        Flask's default passes separators / indent to dumps(), which would
+        route every response through the stdlib encoder.
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        option = self.option | orjson.OPT_APPEND_NEWLINE
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=option), mimetype=self.mimetype
+        )
+
+    def loads(self, s, **kwargs):
+        """Deserialize JSON text or UTF-8 bytes"""
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
@@ -2,142 +2,472 @@
 import requests
 import gzip
 import io
+import codecs
 import csv
+import functools
+import itertools
+import multiprocessing
+import orjson
 import os
 import platform
-from typing import Dict, List, Optional, Tuple
+import re
+import sqlite3
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import time
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Whitespace skipped between tokens
+_WS = ' \t\n\r'
+# Characters that end a map key
+_KEY_END = re.compile(r'[=;{}\[\]]')
+# Characters a plain string value has to look at; everything else is skipped in bulk
+_STRING_SPECIAL = re.compile(r'[{}\[\],;]')
+# ',' inside a string is a list separator only if followed by { [ or ]
+_LIST_SEP_AHEAD = re.compile(r'[ \t\r\n]*[{\[\]]')
+# ';' inside a string is a map separator only if followed by identifier=
+_MAP_SEP_AHEAD = re.compile(r'[ \t\r\n]*\w+=')
+
+# udajTyp codes compared by the extraction code; parsed values equal to one of
+# these are replaced by the interned constant
+_INTERNED_VALUES = {code: sys.intern(code) for code in (
+    'SIDLO', 'STATUTARNI_ORGAN', 'STATUTARNI_ORGAN_CLEN', 'SPOLECNIK',
+    'SPOLECNIK_OSOBA', 'SPOLECNIK_PRAVNICKA_OSOBA',
+)}
+
+# parse_java_map states
+_VALUE, _MAP_KEY, _MAP_SEP, _LIST_SEP = range(4)
+
+
 def parse_java_map(s):
     """Parse Java Map.toString() format into Python dicts/lists.
 
     Handles: {key=value;key2={nested=val}} and [{...}, {...}] arrays.
     Used for the 'udaje' field in OR justice.cz CSV exports.
-    """
-    pos = [0]
-    length = len(s)
 
-    def skip_ws():
-        while pos[0] < length and s[pos[0]] in ' \t\n\r':
-            pos[0] += 1
-
-    def parse_value():
-        skip_ws()
-        if pos[0] >= length:
-            return ''
-        c = s[pos[0]]
-        if c == '{':
-            return parse_map()
-        elif c == '[':
-            return parse_list()
-        else:
-            return parse_string()
-
-    def parse_map():
-        pos[0] += 1  # skip '{'
-        result = {}
-        skip_ws()
-        if pos[0] < length and s[pos[0]] == '}':
-            pos[0] += 1
-            return result
-        while pos[0] < length:
-            skip_ws()
-            key = parse_key()
-            if not key:
-                break
-            skip_ws()
-            if pos[0] < length and s[pos[0]] == '=':
-                pos[0] += 1  # skip '='
-                val = parse_value()
-                result[key] = val
-            skip_ws()
-            if pos[0] < length and s[pos[0]] == ';':
-                pos[0] += 1  # skip ';'
-            elif pos[0] < length and s[pos[0]] == '}':
-                pos[0] += 1  # skip '}'
-                break
-            else:
-                break
-        return result
-
-    def parse_list():
-        pos[0] += 1  # skip '['
-        result = []
-        skip_ws()
-        if pos[0] < length and s[pos[0]] == ']':
-            pos[0] += 1
-            return result
-        while pos[0] < length:
-            skip_ws()
-            val = parse_value()
-            result.append(val)
-            skip_ws()
-            if pos[0] < length and s[pos[0]] == ',':
-                pos[0] += 1  # skip ','
-                skip_ws()
-            elif pos[0] < length and s[pos[0]] == ']':
-                pos[0] += 1  # skip ']'
-                break
-            else:
-                break
-        return result
-
-    def parse_key():
-        start = pos[0]
-        while pos[0] < length and s[pos[0]] not in '=;{}[]':
-            pos[0] += 1
-        return s[start:pos[0]].strip()
+    Iterative state machine with an explicit stack of open containers (no
+    recursion, so nesting depth is unbounded); plain string spans are skipped
+    with regex searches instead of one character at a time.
+    """
+    try:
+        return _parse_java_map(s)
+    except Exception:
+        return s  # Return raw string on parse failure
 
-    def parse_string():
-        """Parse a string value - ends at ; , } or ] at current nesting depth.
 
-        Uses lookahead for ';' and ',' to avoid splitting text values:
-        - ';' is a separator only if followed by identifier= (map entry)
-        - ',' is a separator only if followed by { or [ or ] (list item boundary)
-        """
-        start = pos[0]
-        depth = 0
-        while pos[0] < length:
-            c = s[pos[0]]
-            if c in '{[':
-                depth += 1
-            elif c in '}]':
-                if depth > 0:
-                    depth -= 1
+def _parse_java_map(s):
+    length = len(s)
+    i = 0
+    # Open containers, innermost last: [dict, pending key] or [list, None]
+    stack = []
+    state = _VALUE
+
+    while True:
+        if state == _VALUE:
+            while i < length and s[i] in _WS:
+                i += 1
+            if i >= length:
+                value = ''
+            else:
+                c = s[i]
+                if c == '{' or c == '[':
+                    close = '}' if c == '{' else ']'
+                    i += 1
+                    while i < length and s[i] in _WS:
+                        i += 1
+                    if i < length and s[i] == close:
+                        i += 1
+                        value = {} if c == '{' else []
+                    elif i >= length:
+                        value = {} if c == '{' else []
+                    elif c == '{':
+                        stack.append([{}, None])
+                        state = _MAP_KEY
+                        continue
+                    else:
+                        stack.append([[], None])
+                        continue  # first item: stay in _VALUE
                 else:
-                    break
-            elif depth == 0 and c == ',':
-                # Lookahead: list separator if followed by { or [ or ]
-                j = pos[0] + 1
-                while j < length and s[j] in ' \t\r\n':
-                    j += 1
-                if j < length and s[j] in '{[]':
-                    break  # List separator
+                    # Plain string: ends at an unmatched } or ], or at a , / ;
+                    # that the lookahead says is a real separator
+                    start = i
+                    depth = 0
+                    while True:
+                        m = _STRING_SPECIAL.search(s, i)
+                        if m is None:
+                            i = length
+                            break
+                        i = m.start()
+                        c = s[i]
+                        if c == '{' or c == '[':
+                            depth += 1
+                        elif c == '}' or c == ']':
+                            if depth == 0:
+                                break
+                            depth -= 1
+                        elif depth == 0:
+                            if c == ',':
+                                if _LIST_SEP_AHEAD.match(s, i + 1):
+                                    break
+                            elif _MAP_SEP_AHEAD.match(s, i + 1):
+                                break
+                        i += 1
+                    value = s[start:i].strip()
+                    value = _INTERNED_VALUES.get(value, value)
+
+        elif state == _MAP_KEY:
+            if i >= length:
+                value = stack.pop()[0]
+            else:
+                while i < length and s[i] in _WS:
+                    i += 1
+                m = _KEY_END.search(s, i)
+                end = m.start() if m else length
+                key = s[i:end].strip()
+                i = end
+                if not key:
+                    value = stack.pop()[0]
                 else:
-                    pos[0] += 1  # Part of text value (e.g. "Výroba, obchod")
+                    while i < length and s[i] in _WS:
+                        i += 1
+                    if i < length and s[i] == '=':
+                        i += 1
+                        # Keys come from a small vocabulary repeated in every nested map
+                        stack[-1][1] = sys.intern(key)
+                        state = _VALUE
+                    else:
+                        state = _MAP_SEP
                     continue
-            elif depth == 0 and c == ';':
-                # Lookahead: map separator if followed by identifier=
-                j = pos[0] + 1
-                while j < length and s[j] in ' \t\r\n':
-                    j += 1
-                k = j
-                while k < length and (s[k].isalnum() or s[k] == '_'):
-                    k += 1
-                if k > j and k < length and s[k] == '=':
-                    break  # Map entry separator
-                else:
-                    pos[0] += 1  # Part of text value
+
+        elif state == _MAP_SEP:
+            while i < length and s[i] in _WS:
+                i += 1
+            if i < length and s[i] == ';':
+                i += 1
+                state = _MAP_KEY
+                continue
+            if i < length and s[i] == '}':
+                i += 1
+            value = stack.pop()[0]
+
+        else:  # _LIST_SEP
+            while i < length and s[i] in _WS:
+                i += 1
+            if i < length and s[i] == ',':
+                i += 1
+                while i < length and s[i] in _WS:
+                    i += 1
+                if i < length:
+                    state = _VALUE
                     continue
-            pos[0] += 1
-        return s[start:pos[0]].strip()
+                value = stack.pop()[0]
+            else:
+                if i < length and s[i] == ']':
+                    i += 1
+                value = stack.pop()[0]
+
+        # A finished value: hand it to the enclosing container
+        if not stack:
+            return value
+        frame = stack[-1]
+        container = frame[0]
+        if type(container) is dict:
+            container[frame[1]] = value
+            state = _MAP_SEP
+        else:
+            container.append(value)
+            state = _LIST_SEP
+
+
+def _open_csv_bytes(filepath: str):
+    """Open an OR CSV for binary reading; .gz files are decompressed on the fly"""
+    if filepath.endswith('.gz'):
+        return gzip.open(filepath, 'rb')
+    return open(filepath, 'rb')
+
+
+def detect_csv_encoding(filepath: str, sample_size: int = 65536) -> str:
+    """Pick the encoding of an OR CSV from a byte sample: BOM, then strict UTF-8, then Czech code pages.
+
+    Decoding only the first line is not enough - windows-1250 accepts most
+    UTF-8 byte sequences and would silently garble diacritics.
+    """
+    with _open_csv_bytes(filepath) as f:
+        head = f.read(sample_size)
+
+    if head.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    for encoding in ('utf-8', 'windows-1250'):
+        try:
+            # Incremental decode: a character cut off at the end of the sample is not an error
+            codecs.getincrementaldecoder(encoding)().decode(head, final=False)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return 'iso-8859-2'
+
+
+# Bytes per network read when downloading a dataset
+DOWNLOAD_CHUNK_BYTES = 1 << 20
 
+
+# Concurrent ISIR lookups in batch_check_isir, and the request rate they share
+ISIR_WORKERS = 8
+ISIR_REQUESTS_PER_SECOND = 20
+
+
+class _RateLimiter:
+    """Spaces calls to wait() at least 1/rate seconds apart across threads"""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until this caller's slot comes up"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+# Package names of current OR datasets carry a year from 2025 on
+_CURRENT_YEAR = re.compile(r'20(?:2[5-9]|[3-9]\d)')
+
+# Seconds dataset metadata (package list / package info) is reused before refetching
+DATASET_METADATA_TTL = 3600
+
+# ISIR / OpenCorporates answers kept in the on-disk lookup cache for this long
+LOOKUP_CACHE_MAX_AGE_DAYS = 30
+
+
+# CSV columns read by ORJusticeParser.parse_or_row
+ROW_COLUMNS = ('ico', 'nazev', 'obchodniJmeno', 'udaje', 'sidlo_nazevObce', 'mesto')
+
+# parse_or_csv fans rows out to worker processes only for large imports -
+# below this many rows, starting the pool costs more than it saves. The app
+# itself only loads max_companies=100 (app.py), so it never reaches the pool;
+# only direct parse_or_csv callers with a large max_rows do.
+PARALLEL_PARSE_MIN_ROWS = 20000
+# Rows per worker task
+PARSE_BATCH_ROWS = 1000
+
+
+def _unseen_ico_rows(reader: Iterable[List[str]], columns: List[str],
+                     seen: set) -> Iterator[Tuple[str, Dict]]:
+    """(ico, row) pairs from csv.reader rows, dropping IČOs already in seen.
+
+    The IČO cell is checked on the raw list, so a duplicate costs no row dict
+    and no udaje parse. seen holds only IČOs of companies the caller has
+    accepted, so a duplicate of a row that failed to parse still gets its
+    turn. Rows without an IČO are passed through for parse_or_row to reject
+    (and the caller to count).
+    """
+    # Last occurrence wins for duplicate header names, as with csv.DictReader
+    positions = {name: idx for idx, name in enumerate(columns)}
+    wanted = [(name, positions[name]) for name in ROW_COLUMNS if name in positions]
+    ico_idx = positions.get('ico', len(columns))
+    for values in reader:
+        # Blank lines are skipped, as csv.DictReader did
+        if not values:
+            continue
+        ico = values[ico_idx].strip() if ico_idx < len(values) else ''
+        if ico in seen:
+            continue
+        # Short rows get None for missing cells (DictReader's restval)
+        yield ico, {name: values[idx] if idx < len(values) else None for name, idx in wanted}
+
+
+def _parse_row_safely(parser: 'ORJusticeParser', ico: str, row: Dict):
+    """parse_or_row, returning the exception instead of raising it"""
+    try:
+        return parser.parse_or_row(row, ico)
+    except Exception as e:
+        return e
+
+
+# Per-worker-process parser, created by the first batch the worker runs
+_worker_parser: Optional['ORJusticeParser'] = None
+
+
+def _parse_row_batch(rows: List[Tuple[str, Dict]]) -> List:
+    """Process-pool task: _parse_row_safely over a batch of (ico, row) pairs"""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = ORJusticeParser()
+    parser = _worker_parser
+    results = [_parse_row_safely(parser, ico, row) for ico, row in rows]
+    # A plain RuntimeError always pickles; the message is all the caller prints
+    return [RuntimeError(str(r)) if isinstance(r, Exception) else r for r in results]
+
+
+def _parse_rows_parallel(rows: Iterable[Tuple[str, Dict]], workers: int) -> Iterator:
+    """Yield parse_or_row results in row order, parsing batches on a process pool.
+
+    Only a few batches per worker are in flight, so the CSV is read as fast
+    as it is consumed; closing the generator cancels the rest.
+    """
+    rows = iter(rows)
+    batches = iter(lambda: list(itertools.islice(rows, PARSE_BATCH_ROWS)), [])
+    # spawn, not fork: the caller may be a multi-threaded server worker
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+    try:
+        pending = deque(pool.submit(_parse_row_batch, batch)
+                        for batch in itertools.islice(batches, workers * 2))
+        while pending:
+            results = pending.popleft().result()
+            batch = next(batches, None)
+            if batch is not None:
+                pending.append(pool.submit(_parse_row_batch, batch))
+            yield from results
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _add_statutory_members(item: Dict, persons_found: Dict[str, str], relationships: List[Tuple]):
+    """STATUTARNI_ORGAN entry: directors / jednatele / board members"""
+    podudaje = item.get('podudaje', [])
+    if type(podudaje) is not list:
+        return
+    for member in podudaje:
+        if type(member) is not dict:
+            continue
+        mt = member.get('udajTyp', {})
+        member_kod = mt.get('kod', '') if type(mt) is dict else ''
+        if member_kod != 'STATUTARNI_ORGAN_CLEN':
+            continue
+
+        osoba = member.get('osoba', {})
+        if not osoba:
+            continue
+
+        jmeno = osoba.get('jmeno', '').strip()
+        prijmeni = osoba.get('prijmeni', '').strip()
+        narozDatum = osoba.get('narozDatum', '').strip()
+
+        if not prijmeni:
+            continue
+
+        person_id = f"RC_{prijmeni}_{jmeno}_{narozDatum}".replace(' ', '_')
+        is_active = not member.get('vymazDatum')
+
+        # Determine role (funkce is typically a plain string like "Jednatel")
+        funkce = member.get('funkce', '')
+        if type(funkce) is dict:
+            role = funkce.get('nazev', 'jednatel').lower()
+        elif type(funkce) is str and funkce:
+            role = funkce.lower()
+        else:
+            role = 'jednatel'
+
+        persons_found[person_id] = f"{jmeno} {prijmeni}".strip()
+        relationships.append((person_id, role or 'jednatel', is_active))
+
+
+def _add_shareholders(item: Dict, persons_found: Dict[str, str], relationships: List[Tuple]):
+    """SPOLECNIK entry: natural-person and legal-entity shareholders (společníci)"""
+    spol_podudaje = item.get('podudaje', [])
+    if type(spol_podudaje) is not list:
+        return
+    for spolecnik in spol_podudaje:
+        if type(spolecnik) is not dict:
+            continue
+        st = spolecnik.get('udajTyp', {})
+        spolecnik_kod = st.get('kod', '') if type(st) is dict else ''
+        is_active = not spolecnik.get('vymazDatum')
+
+        if spolecnik_kod == 'SPOLECNIK_OSOBA':
+            # Natural person shareholder
+            osoba = spolecnik.get('osoba', {})
+            if not osoba:
+                continue
+
+            jmeno = osoba.get('jmeno', '').strip()
+            prijmeni = osoba.get('prijmeni', '').strip()
+            narozDatum = osoba.get('narozDatum', '').strip()
+
+            if not prijmeni:
+                continue
+
+            person_id = f"RC_{prijmeni}_{jmeno}_{narozDatum}".replace(' ', '_')
+            persons_found[person_id] = f"{jmeno} {prijmeni}".strip()
+            relationships.append((person_id, 'společník', is_active))
+
+        elif spolecnik_kod == 'SPOLECNIK_PRAVNICKA_OSOBA':
+            # Legal entity shareholder
+            pravnicka = spolecnik.get('pravnickaOsoba', {})
+            if not pravnicka:
+                continue
+
+            shareholder_ico = pravnicka.get('ico', '').strip()
+            if shareholder_ico:
+                relationships.append((shareholder_ico, 'společník', is_active))
+
+
+# udajTyp code -> handler adding that entry's persons and relationship stubs
+_UDAJ_HANDLERS = {
+    'STATUTARNI_ORGAN': _add_statutory_members,
+    'SPOLECNIK': _add_shareholders,
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _summarize_udaje(udaje_raw: str) -> Tuple[str, Tuple, Tuple]:
+    """Extract (city, persons, relationship stubs) from one raw 'udaje' field.
+
+    OR exports repeat identical udaje blobs across rows, so the summary is
+    memoized on the raw string. It holds only immutable tuples and no row
+    data: persons are (person_id, name) and relationships are (source, type,
+    active), with the target company filled in by parse_or_row.
+    """
+    # parse_java_map builds only plain dict / list / str values, so exact type
+    # checks are equivalent to isinstance and cheaper in these loops
+    udaje = []
     try:
-        return parse_value()
+        parsed = parse_java_map(udaje_raw)
+        if type(parsed) is list:
+            udaje = parsed
+        elif type(parsed) is dict:
+            udaje = [parsed]
     except Exception:
-        return s  # Return raw string on parse failure
+        pass
+
+    city = ''
+    sidlo_found = False
+    relationships = []
+    persons_found = {}  # {person_id: name}
+
+    # One pass over udaje for the city and the relationships
+    for item in udaje:
+        if type(item) is not dict:
+            continue
+        typ = item.get('udajTyp', {})
+        typ_kod = typ.get('kod', '') if type(typ) is dict else ''
+
+        # --- SEAT: city from the first non-deleted SIDLO entry ---
+        if typ_kod == 'SIDLO':
+            if not sidlo_found and not item.get('vymazDatum'):
+                sidlo_found = True
+                adresa = item.get('adresa', {})
+                if type(adresa) is dict:
+                    city = adresa.get('obec', '')
+
+        # --- STATUTORY ORGAN / SHAREHOLDERS ---
+        else:
+            handler = _UDAJ_HANDLERS.get(typ_kod)
+            if handler is not None:
+                handler(item, persons_found, relationships)
+
+    return city, tuple(persons_found.items()), tuple(relationships)
 
 
 class ORJusticeParser:
@@ -145,8 +475,21 @@ class ORJusticeParser:
 
     def __init__(self):
         self.base_url = "https://dataor.justice.cz/api/3/action"
-        self.cache = {}
+        self.cache = {}  # key -> (time.monotonic() when stored, value); see _cache_get
         self.isir_cache = {}  # Cache ISIR lookups
+        # Keep-alive connections shared by every API call; the pool is sized
+        # for batch_check_isir's threads
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=ISIR_WORKERS,
+                              max_retries=Retry(total=2, backoff_factor=0.3))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Request pacing for ISIR lookups
+        self._isir_limiter = _RateLimiter(ISIR_REQUESTS_PER_SECOND)
+        # SQLite copy of ISIR / OpenCorporates answers in cache_dir, opened on
+        # first use (None: not opened yet, False: unavailable)
+        self._lookup_db = None
+        self._lookup_db_lock = threading.Lock()
         self.opencorporates_cache = {}
 
         # CSV cache directory (external to project - data files are large)
@@ -155,10 +498,42 @@ class ORJusticeParser:
         else:
             self.cache_dir = '/var/cache/prepify/or-cache'
 
-    def _get_cache_path(self, dataset_name: str) -> str:
-        """Get cache file path for a dataset"""
+    def _get_cache_path(self, dataset_name: str, suffix: str = '.csv') -> str:
+        """Get cache file path for a dataset ('.csv' or '.csv.gz' suffix)"""
         safe_name = dataset_name.replace('/', '_').replace('\\', '_')
-        return os.path.join(self.cache_dir, f"{safe_name}.csv")
+        return os.path.join(self.cache_dir, f"{safe_name}{suffix}")
+
+    def _query_lookup_cache(self, sql: str, params: tuple) -> Optional[tuple]:
+        """Run one statement on the on-disk lookup cache and return its first row, if any"""
+        with self._lookup_db_lock:
+            if self._lookup_db is None:
+                try:
+                    os.makedirs(self.cache_dir, exist_ok=True)
+                    db = sqlite3.connect(os.path.join(self.cache_dir, 'lookups.sqlite'), check_same_thread=False)
+                    db.execute("CREATE TABLE IF NOT EXISTS isir "
+                               "(ico TEXT PRIMARY KEY, insolvent INTEGER NOT NULL, ts INTEGER NOT NULL)")
+                    db.execute("CREATE TABLE IF NOT EXISTS opencorporates "
+                               "(jurisdiction TEXT, number TEXT, entity BLOB NOT NULL, ts INTEGER NOT NULL, "
+                               "PRIMARY KEY (jurisdiction, number))")
+                    db.commit()
+                    self._lookup_db = db
+                except Exception as e:
+                    print(f"[WARNING] Lookup cache unavailable, using memory only: {e}")
+                    self._lookup_db = False
+            if not self._lookup_db:
+                return None
+
+            try:
+                row = self._lookup_db.execute(sql, params).fetchone()
+                self._lookup_db.commit()
+                return row
+            except sqlite3.Error as e:
+                print(f"[WARNING] Lookup cache query failed: {e}")
+                return None
+
+    def _lookup_cache_min_ts(self) -> int:
+        """Oldest timestamp of a lookup cache row that is still fresh"""
+        return int(time.time()) - LOOKUP_CACHE_MAX_AGE_DAYS * 86400
 
     def _is_cache_valid(self, cache_path: str, max_age_days: int = 7) -> bool:
         """Check if cached file exists and is recent enough"""
@@ -167,13 +542,16 @@ class ORJusticeParser:
         age = time.time() - os.path.getmtime(cache_path)
         return age < max_age_days * 86400
 
-    def parse_or_row(self, row: Dict) -> Tuple[Optional[Dict], List[Dict]]:
+    def parse_or_row(self, row: Dict, ico: Optional[str] = None) -> Tuple[Optional[Dict], List[Dict]]:
         """Parse a single OR CSV row, extracting company + relationships from udaje JSON.
 
+        ico is the row's already stripped IČO when the caller has read it.
+
         Returns:
             (company_dict, list_of_relationship_dicts)
         """
-        ico = row.get('ico', '').strip()
+        if ico is None:
+            ico = row.get('ico', '').strip()
         if not ico:
             return None, []
 
@@ -183,29 +561,11 @@ class ORJusticeParser:
 
         # Parse udaje field (Java Map.toString() format, NOT JSON)
         udaje_raw = row.get('udaje', '')
-        udaje = []
         if udaje_raw:
-            try:
-                parsed = parse_java_map(udaje_raw)
-                if isinstance(parsed, list):
-                    udaje = parsed
-                elif isinstance(parsed, dict):
-                    udaje = [parsed]
-            except Exception:
-                pass
-
-        # Extract city from SIDLO entries (use latest non-deleted SIDLO)
-        city = ''
-        for item in udaje:
-            if not isinstance(item, dict):
-                continue
-            typ = item.get('udajTyp', {})
-            typ_kod = typ.get('kod', '') if isinstance(typ, dict) else ''
-            if typ_kod == 'SIDLO' and not item.get('vymazDatum'):
-                adresa = item.get('adresa', {})
-                if isinstance(adresa, dict):
-                    city = adresa.get('obec', '')
-                break
+            city, persons, relationship_stubs = _summarize_udaje(udaje_raw)
+        else:
+            city, persons, relationship_stubs = '', (), ()
+
         # Fallback: try flat CSV columns for city
         if not city:
             city = row.get('sidlo_nazevObce', row.get('mesto', '')).strip()
@@ -219,138 +579,55 @@ class ORJusticeParser:
             'insolvent': False
         }
 
-        relationships = []
-        persons_found = {}  # {person_id: person_data}
-
-        for item in udaje:
-            if not isinstance(item, dict):
-                continue
-            typ = item.get('udajTyp', {})
-            typ_kod = typ.get('kod', '') if isinstance(typ, dict) else ''
-
-            # --- STATUTORY ORGAN (directors / jednatele / board members) ---
-            if typ_kod == 'STATUTARNI_ORGAN':
-                podudaje = item.get('podudaje', [])
-                if not isinstance(podudaje, list):
-                    continue
-                for member in podudaje:
-                    if not isinstance(member, dict):
-                        continue
-                    mt = member.get('udajTyp', {})
-                    member_kod = mt.get('kod', '') if isinstance(mt, dict) else ''
-                    if member_kod != 'STATUTARNI_ORGAN_CLEN':
-                        continue
-
-                    osoba = member.get('osoba', {})
-                    if not osoba:
-                        continue
-
-                    jmeno = osoba.get('jmeno', '').strip()
-                    prijmeni = osoba.get('prijmeni', '').strip()
-                    narozDatum = osoba.get('narozDatum', '').strip()
-
-                    if not prijmeni:
-                        continue
+        relationships = [
+            {'source': source, 'target': ico, 'type': rel_type, 'active': is_active}
+            for source, rel_type, is_active in relationship_stubs
+        ]
+        persons_found = {  # {person_id: person_data}
+            person_id: {
+                'id': person_id,
+                'name': name,
+                'type': 'person',
+                'city': '',
+                'country': 'CZ',
+                'insolvent': False
+            }
+            for person_id, name in persons
+        }
 
-                    person_id = f"RC_{prijmeni}_{jmeno}_{narozDatum}".replace(' ', '_')
-                    is_active = not member.get('vymazDatum')
+        return company, relationships, persons_found
 
-                    # Determine role (funkce is typically a plain string like "Jednatel")
-                    funkce = member.get('funkce', '')
-                    if isinstance(funkce, dict):
-                        role = funkce.get('nazev', 'jednatel').lower()
-                    elif isinstance(funkce, str) and funkce:
-                        role = funkce.lower()
-                    else:
-                        role = 'jednatel'
-
-                    persons_found[person_id] = {
-                        'id': person_id,
-                        'name': f"{jmeno} {prijmeni}".strip(),
-                        'type': 'person',
-                        'city': '',
-                        'country': 'CZ',
-                        'insolvent': False
-                    }
+    def _cache_get(self, key: str, ttl: float):
+        """Value stored under key within the last ttl seconds, else None"""
+        entry = self.cache.get(key)
+        if entry is None or time.monotonic() - entry[0] > ttl:
+            return None
+        return entry[1]
 
-                    relationships.append({
-                        'source': person_id,
-                        'target': ico,
-                        'type': role or 'jednatel',
-                        'active': is_active
-                    })
-
-            # --- SHAREHOLDERS (společníci) ---
-            elif typ_kod == 'SPOLECNIK':
-                spol_podudaje = item.get('podudaje', [])
-                if not isinstance(spol_podudaje, list):
-                    continue
-                for spolecnik in spol_podudaje:
-                    if not isinstance(spolecnik, dict):
-                        continue
-                    st = spolecnik.get('udajTyp', {})
-                    spolecnik_kod = st.get('kod', '') if isinstance(st, dict) else ''
-                    is_active = not spolecnik.get('vymazDatum')
-
-                    if spolecnik_kod == 'SPOLECNIK_OSOBA':
-                        # Natural person shareholder
-                        osoba = spolecnik.get('osoba', {})
-                        if not osoba:
-                            continue
-
-                        jmeno = osoba.get('jmeno', '').strip()
-                        prijmeni = osoba.get('prijmeni', '').strip()
-                        narozDatum = osoba.get('narozDatum', '').strip()
-
-                        if not prijmeni:
-                            continue
-
-                        person_id = f"RC_{prijmeni}_{jmeno}_{narozDatum}".replace(' ', '_')
-
-                        persons_found[person_id] = {
-                            'id': person_id,
-                            'name': f"{jmeno} {prijmeni}".strip(),
-                            'type': 'person',
-                            'city': '',
-                            'country': 'CZ',
-                            'insolvent': False
-                        }
-
-                        relationships.append({
-                            'source': person_id,
-                            'target': ico,
-                            'type': 'společník',
-                            'active': is_active
-                        })
-
-                    elif spolecnik_kod == 'SPOLECNIK_PRAVNICKA_OSOBA':
-                        # Legal entity shareholder
-                        pravnicka = spolecnik.get('pravnickaOsoba', {})
-                        if not pravnicka:
-                            continue
-
-                        shareholder_ico = pravnicka.get('ico', '').strip()
-                        if shareholder_ico:
-                            relationships.append({
-                                'source': shareholder_ico,
-                                'target': ico,
-                                'type': 'společník',
-                                'active': is_active
-                            })
+    def _cache_put(self, key: str, value):
+        """Store value under key, timestamped for _cache_get"""
+        self.cache[key] = (time.monotonic(), value)
 
-        return company, relationships, persons_found
+    def clear_cache(self):
+        """Forget cached dataset metadata"""
+        self.cache.clear()
 
     def get_latest_dataset_name(self) -> Optional[str]:
         """Get the name of the latest available dataset"""
+        cached = self._cache_get('package_list', DATASET_METADATA_TTL)
+        if cached is not None:
+            return cached
+
         try:
-            response = requests.get(f"{self.base_url}/package_list", timeout=10, verify=False)
+            response = self.session.get(f"{self.base_url}/package_list", timeout=10, verify=False)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             if data.get('success') and data.get('result'):
                 packages = data['result']
-                current_packages = [p for p in packages if '2025' in p or '2026' in p]
-                return current_packages[0] if current_packages else packages[0]
+                name = next((p for p in packages if _CURRENT_YEAR.search(p)), packages[0])
+                self._cache_put('package_list', name)
+                return name
             return None
         except Exception as e:
             print(f"Error fetching package list: {e}")
@@ -358,17 +635,23 @@ class ORJusticeParser:
     
     def get_dataset_info(self, package_name: str) -> Optional[Dict]:
         """Get information about a specific dataset"""
+        cache_key = f"package_show:{package_name}"
+        cached = self._cache_get(cache_key, DATASET_METADATA_TTL)
+        if cached is not None:
+            return cached
+
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/package_show",
                 params={'id': package_name},
                 timeout=10,
                 verify=False
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if data.get('success'):
+                self._cache_put(cache_key, data['result'])
                 return data['result']
             return None
         except Exception as e:
@@ -411,45 +694,33 @@ class ORJusticeParser:
             print("[WARNING] This may take a while (file is ~50-200MB)...")
 
             # Download with streaming
-            response = requests.get(url, stream=True, timeout=120, verify=False)
+            response = self.session.get(url, stream=True, timeout=120, verify=False)
             response.raise_for_status()
 
-            # Save to temp file
+            # Save to temp file; a .gz download stays compressed (parse_or_csv
+            # reads it through gzip)
             import tempfile
-            temp_file = tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.csv')
+            suffix = '.csv.gz' if url.endswith('.gz') else '.csv'
+            temp_file = tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix=suffix)
 
             # Download in chunks
             total_size = int(response.headers.get('content-length', 0))
             downloaded = 0
+            # Print every ~10%: byte threshold of the next report (never hit without a size)
+            report_step = total_size // 10 or 1
+            next_report = report_step if total_size > 0 else float('inf')
 
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
+            try:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_BYTES):
                     temp_file.write(chunk)
                     downloaded += len(chunk)
-                    if total_size > 0:
-                        progress = (downloaded / total_size) * 100
-                        if progress % 10 < 1:  # Print every ~10%
-                            print(f"Downloaded: {progress:.0f}%")
+                    if downloaded >= next_report:
+                        print(f"Downloaded: {downloaded * 100 / total_size:.0f}%")
+                        next_report = (downloaded // report_step + 1) * report_step
+            finally:
+                temp_file.close()
 
-            temp_file.close()
             print(f"[SUCCESS] Download complete: {temp_file.name}")
-
-            # Check if gzipped
-            if url.endswith('.gz'):
-                print("Decompressing gzip file...")
-                import gzip
-                import shutil
-
-                temp_file_gz = temp_file.name
-                temp_file_csv = temp_file.name.replace('.csv', '_extracted.csv')
-
-                with gzip.open(temp_file_gz, 'rb') as f_in:
-                    with open(temp_file_csv, 'wb') as f_out:
-                        shutil.copyfileobj(f_in, f_out)
-
-                print(f"[SUCCESS] Decompressed to: {temp_file_csv}")
-                return temp_file_csv
-
             return temp_file.name
 
         except Exception as e:
@@ -467,28 +738,14 @@ class ORJusticeParser:
         company_icos = set()  # Track which company IČOs we've seen
 
         try:
-            # Try different encodings
-            encodings = ['utf-8', 'windows-1250', 'iso-8859-2']
-            file_handle = None
-
-            for encoding in encodings:
-                try:
-                    file_handle = open(filepath, 'r', encoding=encoding)
-                    first_line = file_handle.readline()
-                    file_handle.seek(0)
-                    print(f"[OK] Encoding: {encoding}")
-                    break
-                except UnicodeDecodeError:
-                    if file_handle:
-                        file_handle.close()
-                    continue
-
-            if not file_handle:
-                print("[ERROR] Could not determine file encoding")
-                return {'companies': [], 'relationships': []}
-
-            reader = csv.DictReader(file_handle)
-            columns = reader.fieldnames or []
+            encoding = detect_csv_encoding(filepath)
+            file_handle = io.TextIOWrapper(_open_csv_bytes(filepath), encoding=encoding)
+            print(f"[OK] Encoding: {encoding}")
+
+            # Plain csv.reader: only the columns parse_or_row reads are picked out
+            # of each row, by index, instead of building a dict of every column
+            reader = csv.reader(file_handle)
+            columns = next(reader, [])
             print(f"[OK] Columns: {columns[:8]}...")
             has_udaje = 'udaje' in columns
             if not has_udaje:
@@ -497,12 +754,23 @@ class ORJusticeParser:
             parsed_count = 0
             skipped = 0
 
-            for i, row in enumerate(reader):
+            # Duplicate IČOs are dropped before the expensive udaje parse
+            rows = _unseen_ico_rows(reader, columns, company_icos)
+
+            workers = os.cpu_count() or 1
+            if max_rows >= PARALLEL_PARSE_MIN_ROWS and workers > 1:
+                print(f"[OR PARSER] Parsing on {workers} processes")
+                results = _parse_rows_parallel(rows, workers)
+            else:
+                results = (_parse_row_safely(self, ico, row) for ico, row in rows)
+
+            for i, result in enumerate(results):
                 if parsed_count >= max_rows:
                     break
 
                 try:
-                    result = self.parse_or_row(row)
+                    if isinstance(result, Exception):
+                        raise result
                     if result[0] is None:
                         skipped += 1
                         continue
@@ -510,7 +778,7 @@ class ORJusticeParser:
                     company, rels, persons = result
                     ico = company['id']
 
-                    # Skip duplicate IČOs
+                    # Rows read ahead by the process pool can still be duplicates
                     if ico in company_icos:
                         continue
                     company_icos.add(ico)
@@ -529,6 +797,7 @@ class ORJusticeParser:
                     if skipped <= 3:
                         print(f"[WARNING] Row {i} parse error: {row_err}")
 
+            results.close()
             file_handle.close()
 
             # Add deduplicated persons to the companies list (they're entities too)
@@ -563,14 +832,16 @@ class ORJusticeParser:
 
         print(f"[OK] Dataset: {dataset_name}")
 
-        # Step 2: Check cache
-        cache_path = self._get_cache_path(dataset_name)
+        # Step 2: Check cache (compressed, or plain from older versions)
         csv_path = None
+        for suffix in ('.csv.gz', '.csv'):
+            cache_path = self._get_cache_path(dataset_name, suffix)
+            if self._is_cache_valid(cache_path):
+                print(f"[CACHE] Using cached CSV: {cache_path}")
+                csv_path = cache_path
+                break
 
-        if self._is_cache_valid(cache_path):
-            print(f"[CACHE] Using cached CSV: {cache_path}")
-            csv_path = cache_path
-        else:
+        if not csv_path:
             # Download fresh
             csv_path = self.download_or_dataset(dataset_name)
             if not csv_path:
@@ -578,6 +849,7 @@ class ORJusticeParser:
                 return {'companies': [], 'relationships': []}
 
             # Copy to cache
+            cache_path = self._get_cache_path(dataset_name, '.csv.gz' if csv_path.endswith('.gz') else '.csv')
             try:
                 os.makedirs(self.cache_dir, exist_ok=True)
                 import shutil
@@ -604,6 +876,12 @@ class ORJusticeParser:
         if ico in self.isir_cache:
             return self.isir_cache[ico]
 
+        row = self._query_lookup_cache("SELECT insolvent FROM isir WHERE ico = ? AND ts >= ?",
+                                       (ico, self._lookup_cache_min_ts()))
+        if row is not None:
+            self.isir_cache[ico] = bool(row[0])
+            return self.isir_cache[ico]
+
         try:
             # ISIR API endpoint for insolvency registry
             url = "https://isir.justice.cz/isir/common/api/v1/subjects"
@@ -613,13 +891,17 @@ class ORJusticeParser:
                 'limit': 1
             }
 
-            response = requests.get(url, params=params, timeout=5, verify=False)
+            self._isir_limiter.wait()
+            response = self.session.get(url, params=params, timeout=5, verify=False)
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 # If any records found, company has insolvency proceedings
                 is_insolvent = len(data.get('items', [])) > 0
                 self.isir_cache[ico] = is_insolvent
+                # Only real answers are persisted; failures below stay in memory
+                self._query_lookup_cache("INSERT OR REPLACE INTO isir VALUES (?, ?, ?)",
+                                         (ico, int(is_insolvent), int(time.time())))
                 return is_insolvent
 
             # If API fails, assume not insolvent
@@ -635,17 +917,22 @@ class ORJusticeParser:
         """Batch check ISIR insolvency status for multiple companies"""
         print(f"Checking ISIR insolvency status for {len(companies)} companies...")
 
-        for i, company in enumerate(companies):
-            if i % 50 == 0:
-                print(f"ISIR check progress: {i}/{len(companies)}")
-
-            ico = company['id']
-            is_insolvent = self.check_isir_insolvency(ico)
-            company['insolvent'] = is_insolvent
+        # Cached IČOs are answered directly; the rest go to a thread pool whose
+        # requests share the ISIR rate limit (be nice to the API)
+        uncached = []
+        for company in companies:
+            if company['id'] in self.isir_cache:
+                company['insolvent'] = self.isir_cache[company['id']]
+            else:
+                uncached.append(company)
 
-            # Rate limiting - be nice to the API
-            if i % 10 == 0:
-                time.sleep(0.5)
+        with ThreadPoolExecutor(max_workers=ISIR_WORKERS) as executor:
+            futures = {executor.submit(self.check_isir_insolvency, company['id']): company
+                       for company in uncached}
+            for i, future in enumerate(as_completed(futures)):
+                if i % 50 == 0:
+                    print(f"ISIR check progress: {i}/{len(uncached)}")
+                futures[future]['insolvent'] = future.result()
 
         insolvent_count = sum(1 for c in companies if c.get('insolvent'))
         print(f"[SUCCESS] Found {insolvent_count} insolvent companies")
@@ -659,14 +946,21 @@ class ORJusticeParser:
         if cache_key in self.opencorporates_cache:
             return self.opencorporates_cache[cache_key]
 
+        row = self._query_lookup_cache(
+            "SELECT entity FROM opencorporates WHERE jurisdiction = ? AND number = ? AND ts >= ?",
+            (jurisdiction, company_number, self._lookup_cache_min_ts()))
+        if row is not None:
+            self.opencorporates_cache[cache_key] = orjson.loads(row[0])
+            return self.opencorporates_cache[cache_key]
+
         try:
             # OpenCorporates API endpoint
             url = f"https://api.opencorporates.com/v0.4/companies/{jurisdiction}/{company_number}"
 
-            response = requests.get(url, timeout=10, verify=False)
+            response = self.session.get(url, timeout=10, verify=False)
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 company_data = data.get('results', {}).get('company', {})
 
                 if company_data:
@@ -680,6 +974,9 @@ class ORJusticeParser:
                     }
 
                     self.opencorporates_cache[cache_key] = entity
+                    self._query_lookup_cache("INSERT OR REPLACE INTO opencorporates VALUES (?, ?, ?, ?)",
+                                             (jurisdiction, company_number, orjson.dumps(entity),
+                                              int(time.time())))
                     return entity
 
             return None
@@ -765,460 +1062,12 @@ class ORJusticeParser:
         """
         print("[SYNTHETIC] Loading synthetic dataset with 107 entities...")
 
-        companies = []
-
-        # 107 entities: 65 Czech companies, 25 persons, 17 foreign companies
-        # Format: (ico, name, city, insolvent, country)
-        sample_entities = [
-                # ========== CZECH COMPANIES (65) ==========
-                # --- Tech / Internet (12) ---
-                ("45274649", "Avast Software s.r.o.", "Praha", False, "CZ"),
-                ("27116158", "Mall Group a.s.", "Praha", False, "CZ"),
-                ("63998505", "Alza.cz a.s.", "Praha", False, "CZ"),
-                ("26168685", "Rohlík.cz s.r.o.", "Praha", False, "CZ"),
-                ("26493241", "Seznam.cz, a.s.", "Praha", False, "CZ"),
-                ("29148928", "Socialbakers a.s.", "Praha", False, "CZ"),
-                ("28169522", "JetBrains s.r.o.", "Praha", False, "CZ"),
-                ("24675539", "Kentico Software s.r.o.", "Brno", False, "CZ"),
-                ("29307880", "Y Soft Corporation a.s.", "Brno", False, "CZ"),
-                ("26441381", "GoodData s.r.o.", "Praha", False, "CZ"),
-                ("05765251", "Productboard s.r.o.", "Praha", False, "CZ"),
-                ("28434498", "Zásilkovna s.r.o.", "Praha", False, "CZ"),
-                # --- Finance / Banking (5) ---
-                ("00025593", "Československá obchodní banka, a. s.", "Praha", False, "CZ"),
-                ("00001834", "Česká spořitelna, a.s.", "Praha", False, "CZ"),
-                ("00023272", "Komerční banka, a.s.", "Praha", False, "CZ"),
-                ("00003468", "Česká pojišťovna a.s.", "Praha", False, "CZ"),
-                ("26177005", "Home Credit a.s.", "Brno", False, "CZ"),
-                # --- Telecom (1) ---
-                ("24287903", "O2 Czech Republic a.s.", "Praha", False, "CZ"),
-                # --- Energy (6) ---
-                ("60197901", "ČEZ, a.s.", "Praha", False, "CZ"),
-                ("25788001", "Energo-Pro a.s.", "Praha", False, "CZ"),
-                ("26840065", "EPH a.s.", "Praha", False, "CZ"),
-                ("25312782", "ČEZ Distribuce, a.s.", "Děčín", False, "CZ"),
-                ("26418814", "Net4Gas s.r.o.", "Praha", False, "CZ"),
-                ("88990011", "Severomoravská energetika s.r.o.", "Ostrava", False, "CZ"),
-                # --- Manufacturing / Heavy Industry (13) ---
-                ("45534306", "Škoda Auto a.s.", "Mladá Boleslav", False, "CZ"),
-                ("60193336", "Pilsner Urquell a.s.", "Plzeň", False, "CZ"),
-                ("25612093", "Kofola ČeskoSlovensko a.s.", "Ostrava", False, "CZ"),
-                ("60193468", "Plzeňský Prazdroj, a.s.", "Plzeň", False, "CZ"),
-                ("60193531", "Budějovický Budvar, n.p.", "České Budějovice", False, "CZ"),
-                ("63078333", "Moravia Steel a.s.", "Třinec", False, "CZ"),
-                ("47675829", "ArcelorMittal Ostrava a.s.", "Ostrava", False, "CZ"),
-                ("48173355", "Vítkovice Holding a.s.", "Ostrava", False, "CZ"),
-                ("25860011", "Tatra Trucks a.s.", "Kopřivnice", False, "CZ"),
-                ("47150904", "TŘINECKÉ ŽELEZÁRNY, a.s.", "Třinec", False, "CZ"),
-                ("45193509", "LINET spol. s r.o.", "Slaný", False, "CZ"),
-                ("25649329", "Moravská ocelárna s.r.o.", "Ostrava", False, "CZ"),
-                ("44556600", "Liberecký textil a.s.", "Liberec", False, "CZ"),
-                # --- Investment / Holdings (5) ---
-                ("49240480", "Agrofert, a.s.", "Praha", False, "CZ"),
-                ("63480174", "Penta Investments s.r.o.", "Praha", False, "CZ"),
-                ("28185480", "Rockaway Capital s.r.o.", "Praha", False, "CZ"),
-                ("28195078", "Avast Holding a.s.", "Praha", False, "CZ"),
-                ("25302914", "CZEC Holdings s.r.o.", "Praha", False, "CZ"),
-                # --- Construction / Real Estate (5) ---
-                ("49241257", "Metrostav a.s.", "Praha", False, "CZ"),
-                ("26267063", "CTP Invest s.r.o.", "Humpolec", False, "CZ"),
-                ("55667788", "Reality Invest Praha s.r.o.", "Praha", False, "CZ"),
-                ("66778899", "Reality Invest Brno s.r.o.", "Brno", False, "CZ"),
-                ("60108088", "Komerční reality s.r.o.", "Praha", False, "CZ"),
-                # --- Ostrava Regional (3) ---
-                ("27082440", "Ostrava Property Development s.r.o.", "Ostrava", False, "CZ"),
-                ("26830311", "Ostravské vodárny a kanalizace a.s.", "Ostrava", False, "CZ"),
-                ("77889900", "Dopravní podnik Ostrava a.s.", "Ostrava", False, "CZ"),
-                # --- Pharma / Health (2) ---
-                ("26178559", "Zentiva Group a.s.", "Praha", False, "CZ"),
-                ("25671651", "Novaservis a.s.", "Brno", False, "CZ"),
-                # --- Media / Logistics (2) ---
-                ("26505398", "Prima TV a.s.", "Praha", False, "CZ"),
-                ("11223300", "Prague Logistics s.r.o.", "Praha", False, "CZ"),
-                # --- Agriculture / Mining / Regional (5) ---
-                ("22334400", "Moravský zemědělský fond a.s.", "Olomouc", False, "CZ"),
-                ("33445500", "Jihočeské doly a.s.", "České Budějovice", False, "CZ"),
-                ("99001122", "Technologický park Brno a.s.", "Brno", False, "CZ"),
-                ("25352555", "OKD, a.s.", "Ostrava", False, "CZ"),
-                ("66001122", "Liberecké sklárny a.s.", "Liberec", False, "CZ"),
-                # --- State Enterprise (1) ---
-                ("00000795", "Státní tiskárna cenin, s.p.", "Praha", False, "CZ"),
-                # --- Insolvent Companies (5) ---
-                ("12345678", "Bankrot Trading s.r.o.", "Praha", True, "CZ"),
-                ("87654321", "Dlužník Investments a.s.", "Brno", True, "CZ"),
-                ("15890520", "Firma v insolvenci s.r.o.", "Ostrava", True, "CZ"),
-                ("33344455", "Zkrachovalá stavební a.s.", "Praha", True, "CZ"),
-                ("44556677", "Dluh Reality s.r.o.", "Brno", True, "CZ"),
-
-                # ========== PERSONS (25) ==========
-                ("RC001", "Jan Novák", "Praha", False, "CZ"),
-                ("RC002", "Petr Svoboda", "Brno", False, "CZ"),
-                ("RC003", "Marie Nováková", "Praha", False, "CZ"),
-                ("RC004", "Karel Dvořák", "Praha", False, "CZ"),
-                ("RC005", "Tomáš Procházka", "Ostrava", False, "CZ"),
-                ("RC006", "Eva Černá", "Praha", False, "CZ"),
-                ("RC007", "Jiří Veselý", "Brno", False, "CZ"),
-                ("RC008", "Lucie Krejčová", "Praha", False, "CZ"),
-                ("RC009", "Martin Horák", "Plzeň", False, "CZ"),
-                ("RC010", "Barbora Němcová", "Ostrava", False, "CZ"),
-                ("RC011", "Ondřej Marek", "Praha", False, "CZ"),
-                ("RC012", "Zuzana Pospíšilová", "Brno", False, "CZ"),
-                ("RC013", "David Král", "Praha", False, "CZ"),
-                ("RC014", "Andrea Sedláčková", "Ostrava", False, "CZ"),
-                ("RC015", "Filip Holub", "Praha", False, "CZ"),
-                ("RC016", "Tereza Vlčková", "Olomouc", False, "CZ"),
-                ("RC017", "Radek Bartoš", "Praha", False, "CZ"),
-                ("RC018", "Jana Říhová", "Liberec", False, "CZ"),
-                ("RC019", "Michal Šťastný", "Praha", False, "CZ"),
-                ("RC020", "Petra Urbanová", "Brno", False, "CZ"),
-                ("RC021", "Lukáš Fiala", "České Budějovice", False, "CZ"),
-                ("RC022", "Markéta Benešová", "Praha", False, "CZ"),
-                ("RC023", "Vojtěch Kopecký", "Ostrava", False, "CZ"),
-                ("RC024", "Daniela Marková", "Plzeň", False, "CZ"),
-                ("RC025", "Stanislav Růžička", "Praha", False, "CZ"),
-
-                # ========== FOREIGN COMPANIES (17) ==========
-                # --- Cyprus (4) ---
-                ("CY001", "Cyprus Holdings Ltd.", "Nicosia", False, "CY"),
-                ("CY002", "Offshore Investments Ltd.", "Limassol", False, "CY"),
-                ("CY003", "Lemesos Trading Ltd.", "Limassol", False, "CY"),
-                ("CY004", "Eurogate Holdings Ltd.", "Nicosia", False, "CY"),
-                # --- Netherlands (4) ---
-                ("NL001", "Amsterdam Ventures B.V.", "Amsterdam", False, "NL"),
-                ("NL002", "Rotterdam Holdings N.V.", "Rotterdam", False, "NL"),
-                ("NL003", "Dutch Capital Management B.V.", "Amsterdam", False, "NL"),
-                ("NL004", "Eindhoven Tech Invest B.V.", "Eindhoven", False, "NL"),
-                # --- Slovakia (3) ---
-                ("SK001", "Bratislava Holdings a.s.", "Bratislava", False, "SK"),
-                ("SK002", "Košice Industrial s.r.o.", "Košice", False, "SK"),
-                ("SK003", "Žilina Energo s.r.o.", "Žilina", False, "SK"),
-                # --- Germany (3) ---
-                ("DE001", "München Beteiligungen GmbH", "München", False, "DE"),
-                ("DE002", "Berlin Automotive AG", "Berlin", False, "DE"),
-                ("DE003", "Hamburg Logistik GmbH", "Hamburg", False, "DE"),
-                # --- Luxembourg (2) ---
-                ("LU001", "Luxembourg Finance S.A.", "Luxembourg", False, "LU"),
-                ("LU002", "Grand Duchy Capital S.à r.l.", "Luxembourg", False, "LU"),
-                # --- UK (1) ---
-                ("UK001", "London Equity Partners LLP", "London", False, "UK"),
-        ]
+        # Copies: callers such as batch_check_isir update entities in place
+        companies = [dict(entity) for entity in _sample_companies()]
 
-        for ico, name, city, insolvent, country in sample_entities:
-            entity_type = 'person' if ico.startswith('RC') else 'company'
-            companies.append({
-                'id': ico,
-                'name': name,
-                'type': entity_type,
-                'city': city,
-                'insolvent': insolvent,
-                'country': country
-            })
-
-        # ~220 relationships modeling realistic Czech corporate structures
-        # Patterns: holding structures, shared directors, offshore ownership chains,
-        # supply chains, financial connections, insolvency networks
         relationships = [
-            # =============================================
-            # TECH / INTERNET CLUSTER
-            # =============================================
-            # Directors & board members
-            {'source': 'RC001', 'target': '45274649', 'type': 'jednatel', 'active': True},
-            {'source': 'RC001', 'target': '28195078', 'type': 'člen představenstva', 'active': True},
-            {'source': 'RC006', 'target': '27116158', 'type': 'jednatelka', 'active': True},
-            {'source': 'RC008', 'target': '63998505', 'type': 'jednatelka', 'active': True},
-            {'source': 'RC002', 'target': '63998505', 'type': 'člen dozorčí rady', 'active': True},
-            {'source': 'RC011', 'target': '26168685', 'type': 'jednatel', 'active': True},
-            {'source': 'RC013', 'target': '26493241', 'type': 'jednatel', 'active': True},
-            {'source': 'RC015', 'target': '29148928', 'type': 'jednatel', 'active': True},
-            {'source': 'RC019', 'target': '28169522', 'type': 'jednatel', 'active': True},
-            {'source': 'RC007', 'target': '24675539', 'type': 'jednatel', 'active': True},
-            {'source': 'RC012', 'target': '29307880', 'type': 'jednatelka', 'active': True},
-            {'source': 'RC022', 'target': '26441381', 'type': 'jednatelka', 'active': True},
-            {'source': 'RC025', 'target': '05765251', 'type': 'jednatel', 'active': True},
-            {'source': 'RC003', 'target': '28434498', 'type': 'jednatelka', 'active': True},
-            # Ownership & investment in tech
-            {'source': '28195078', 'target': '45274649', 'type': 'mateřská společnost', 'active': True},
-            {'source': '28185480', 'target': '27116158', 'type': 'investor', 'active': True},
-            {'source': '28185480', 'target': '26168685', 'type': 'investor', 'active': True},
-            {'source': '28185480', 'target': '28434498', 'type': 'investor', 'active': True},
-            {'source': 'NL004', 'target': '26493241', 'type': 'akcionář', 'active': True},
-            {'source': 'CY001', 'target': '45274649', 'type': 'akcionář', 'active': True},
-            {'source': 'UK001', 'target': '29148928', 'type': 'investor', 'active': True},
-            {'source': 'NL001', 'target': '05765251', 'type': 'investor', 'active': True},
-            {'source': '45274649', 'target': '27116158', 'type': 'společník', 'active': True},
-            {'source': '27116158', 'target': '63998505', 'type': 'investor', 'active': True},
-            {'source': '63998505', 'target': '26168685', 'type': 'obchodní partner', 'active': True},
-            {'source': '26441381', 'target': '29148928', 'type': 'strategický partner', 'active': True},
-            {'source': '05765251', 'target': '26441381', 'type': 'obchodní partner', 'active': True},
-            {'source': '99001122', 'target': '24675539', 'type': 'inkubátor', 'active': True},
-            {'source': '99001122', 'target': '29307880', 'type': 'inkubátor', 'active': True},
-            {'source': '28434498', 'target': '63998505', 'type': 'dodavatel', 'active': True},
-
-            # =============================================
-            # FINANCE / BANKING CLUSTER
-            # =============================================
-            # Directors & board members
-            {'source': 'RC004', 'target': '00025593', 'type': 'člen představenstva', 'active': True},
-            {'source': 'RC004', 'target': '00001834', 'type': 'člen dozorčí rady', 'active': True},
-            {'source': 'RC011', 'target': '00023272', 'type': 'člen představenstva', 'active': True},
-            {'source': 'RC006', 'target': '00003468', 'type': 'člen dozorčí rady', 'active': True},
-            {'source': 'RC020', 'target': '26177005', 'type': 'jednatelka', 'active': True},
-            {'source': 'RC022', 'target': '00001834', 'type': 'člen představenstva', 'active': True},
-            {'source': 'RC011', 'target': '00003468', 'type': 'člen dozorčí rady', 'active': True},
-            # Financial relationships
-            {'source': 'NL001', 'target': '00001834', 'type': 'akcionář', 'active': True},
-            {'source': '00025593', 'target': 'NL002', 'type': 'dceřiná společnost', 'active': True},
-            {'source': '00001834', 'target': '00025593', 'type': 'mezibankovní partner', 'active': True},
-            {'source': '00023272', 'target': '00003468', 'type': 'pojistný partner', 'active': True},
-            {'source': 'LU001', 'target': '00025593', 'type': 'akcionář', 'active': True},
-            {'source': 'LU001', 'target': '00023272', 'type': 'akcionář', 'active': True},
-            {'source': 'LU002', 'target': 'LU001', 'type': 'mateřská společnost', 'active': True},
-            {'source': '26177005', 'target': 'SK001', 'type': 'dceřiná společnost', 'active': True},
-            {'source': 'RC001', 'target': '00001834', 'type': 'akcionář', 'active': True},
-            # Bank-client relationships
-            {'source': '00001834', 'target': '55667788', 'type': 'věřitel', 'active': True},
-            {'source': '00023272', 'target': '66778899', 'type': 'věřitel', 'active': True},
-            {'source': '00025593', 'target': '49241257', 'type': 'věřitel', 'active': True},
-            {'source': '45534306', 'target': '00001834', 'type': 'klient', 'active': True},
-
-            # =============================================
-            # ENERGY CLUSTER
-            # =============================================
-            # Directors & board members
-            {'source': 'RC017', 'target': '60197901', 'type': 'člen představenstva', 'active': True},
-            {'source': 'RC017', 'target': '26840065', 'type': 'předseda představenstva', 'active': True},
-            {'source': 'RC017', 'target': '25312782', 'type': 'člen dozorčí rady', 'active': True},
-            {'source': 'RC025', 'target': '25788001', 'type': 'jednatel', 'active': True},
-            {'source': 'RC013', 'target': '26418814', 'type': 'jednatel', 'active': True},
-            {'source': 'RC014', 'target': '88990011', 'type': 'jednatelka', 'active': True},
-            # Corporate structure
-            {'source': '60197901', 'target': '25312782', 'type': 'mateřská společnost', 'active': True},
-            {'source': '26840065', 'target': '25788001', 'type': 'dceřiná společnost', 'active': True},
-            {'source': '26840065', 'target': '26418814', 'type': 'dceřiná společnost', 'active': True},
-            {'source': '26840065', 'target': '88990011', 'type': 'dceřiná společnost', 'active': True},
-            {'source': 'DE001', 'target': '26840065', 'type': 'akcionář', 'active': True},
-            {'source': 'CY003', 'target': '26840065', 'type': 'akcionář', 'active': True},
-            {'source': 'NL003', 'target': 'CY003', 'type': 'mateřská společnost', 'active': True},
-            {'source': 'SK003', 'target': '88990011', 'type': 'dodavatel', 'active': True},
-            # Energy supply to industry
-            {'source': '60197901', 'target': '45534306', 'type': 'dodavatel', 'active': True},
-            {'source': '60197901', 'target': '47675829', 'type': 'dodavatel', 'active': True},
-            {'source': '88990011', 'target': '77889900', 'type': 'dodavatel', 'active': True},
-            {'source': '88990011', 'target': '26830311', 'type': 'dodavatel', 'active': True},
-
-            # =============================================
-            # MANUFACTURING / HEAVY INDUSTRY CLUSTER
-            # =============================================
-            # Directors & board members
-            {'source': 'RC009', 'target': '60193336', 'type': 'člen představenstva', 'active': True},
-            {'source': 'RC009', 'target': '60193468', 'type': 'člen dozorčí rady', 'active': True},
-            {'source': 'RC024', 'target': '60193336', 'type': 'člen dozorčí rady', 'active': True},
-            {'source': 'RC005', 'target': '47675829', 'type': 'člen představenstva', 'active': True},
-            {'source': 'RC005', 'target': '48173355', 'type': 'předseda představenstva', 'active': True},
-            {'source': 'RC005', 'target': '63078333', 'type': 'člen dozorčí rady', 'active': True},
-            {'source': 'RC023', 'target': '25649329', 'type': 'jednatel', 'active': True},
-            {'source': 'RC023', 'target': '47150904', 'type': 'člen představenstva', 'active': True},
-            {'source': 'RC010', 'target': '25860011', 'type': 'člen dozorčí rady', 'active': True},
-            {'source': 'RC021', 'target': '60193531', 'type': 'člen představenstva', 'active': True},
-            {'source': 'RC018', 'target': '44556600', 'type': 'jednatelka', 'active': True},
-            {'source': 'RC024', 'target': '45193509', 'type': 'jednatelka', 'active': True},
-            # Automotive supply chain
-            {'source': 'DE002', 'target': '45534306', 'type': 'akcionář', 'active': True},
-            {'source': '45534306', 'target': '25860011', 'type': 'odběratel', 'active': True},
-            {'source': 'DE002', 'target': '25860011', 'type': 'strategický partner', 'active': True},
-            {'source': '45534306', 'target': '25312782', 'type': 'odběratel', 'active': True},
-            # Steel / mining supply chain
-            {'source': '47675829', 'target': '63078333', 'type': 'dodavatel', 'active': True},
-            {'source': '63078333', 'target': '47150904', 'type': 'dodavatel', 'active': True},
-            {'source': '47150904', 'target': '25649329', 'type': 'dodavatel', 'active': True},
-            {'source': '48173355', 'target': '47675829', 'type': 'strategický partner', 'active': True},
-            {'source': '25352555', 'target': '47675829', 'type': 'dodavatel', 'active': True},
-            {'source': '25352555', 'target': '48173355', 'type': 'dodavatel', 'active': True},
-            {'source': 'SK002', 'target': '63078333', 'type': 'obchodní partner', 'active': True},
-            {'source': 'SK002', 'target': '47150904', 'type': 'dodavatel', 'active': True},
-            {'source': '33445500', 'target': '47675829', 'type': 'dodavatel', 'active': True},
-            # Beer & beverage connections
-            {'source': '60193336', 'target': '60193468', 'type': 'sesterská společnost', 'active': True},
-            {'source': '25612093', 'target': '60193336', 'type': 'konkurent', 'active': True},
-            {'source': '60193531', 'target': '60193336', 'type': 'konkurent', 'active': True},
-            {'source': '25612093', 'target': 'SK001', 'type': 'dceřiná společnost', 'active': True},
-            {'source': '60193336', 'target': '45534306', 'type': 'dodavatel', 'active': True},
-            {'source': 'NL001', 'target': '45534306', 'type': 'akcionář', 'active': True},
-            # Liberec manufacturing
-            {'source': '44556600', 'target': '66001122', 'type': 'dodavatel', 'active': True},
-            {'source': '44556600', 'target': '49241257', 'type': 'dodavatel', 'active': True},
-            {'source': 'RC018', 'target': '66001122', 'type': 'jednatelka', 'active': True},
-
-            # =============================================
-            # INVESTMENT / HOLDINGS CLUSTER
-            # =============================================
-            # Directors & board members
-            {'source': 'RC004', 'target': '49240480', 'type': 'předseda představenstva', 'active': True},
-            {'source': 'RC004', 'target': '63480174', 'type': 'člen představenstva', 'active': True},
-            {'source': 'RC011', 'target': '28185480', 'type': 'jednatel', 'active': True},
-            {'source': 'RC015', 'target': '25302914', 'type': 'jednatel', 'active': True},
-            {'source': 'RC019', 'target': '63480174', 'type': 'člen dozorčí rady', 'active': True},
-            # Portfolio holdings
-            {'source': '49240480', 'target': '22334400', 'type': 'dceřiná společnost', 'active': True},
-            {'source': '49240480', 'target': '26178559', 'type': 'akcionář', 'active': True},
-            {'source': '49240480', 'target': '26505398', 'type': 'akcionář', 'active': True},
-            {'source': '49240480', 'target': '60193531', 'type': 'akcionář', 'active': True},
-            {'source': '63480174', 'target': '26177005', 'type': 'investor', 'active': True},
-            {'source': '63480174', 'target': '00003468', 'type': 'akcionář', 'active': True},
-            {'source': '63480174', 'target': '26178559', 'type': 'investor', 'active': True},
-            {'source': '25302914', 'target': '55667788', 'type': 'mateřská společnost', 'active': True},
-            {'source': '25302914', 'target': '66778899', 'type': 'mateřská společnost', 'active': True},
-            # Offshore investment chains
-            {'source': 'CY004', 'target': '63480174', 'type': 'akcionář', 'active': True},
-            {'source': 'LU002', 'target': 'CY004', 'type': 'mateřská společnost', 'active': True},
-            {'source': 'UK001', 'target': 'LU002', 'type': 'investor', 'active': True},
-            {'source': 'NL003', 'target': '49240480', 'type': 'akcionář', 'active': True},
-            {'source': 'CY002', 'target': '28185480', 'type': 'akcionář', 'active': True},
-            {'source': 'CY004', 'target': '25302914', 'type': 'investor', 'active': True},
-            {'source': 'CY002', 'target': '27116158', 'type': 'investor', 'active': True},
-
-            # =============================================
-            # CONSTRUCTION / REAL ESTATE CLUSTER
-            # =============================================
-            # Directors & board members
-            {'source': 'RC008', 'target': '49241257', 'type': 'člen představenstva', 'active': True},
-            {'source': 'RC016', 'target': '26267063', 'type': 'jednatelka', 'active': True},
-            {'source': 'RC015', 'target': '55667788', 'type': 'jednatel', 'active': True},
-            {'source': 'RC020', 'target': '66778899', 'type': 'jednatelka', 'active': True},
-            {'source': 'RC019', 'target': '60108088', 'type': 'jednatel', 'active': True},
-            # Business relationships
-            {'source': '49241257', 'target': '26267063', 'type': 'dodavatel', 'active': True},
-            {'source': '49241257', 'target': '55667788', 'type': 'dodavatel', 'active': True},
-            {'source': '26267063', 'target': '66778899', 'type': 'investor', 'active': True},
-            {'source': '55667788', 'target': '60108088', 'type': 'obchodní partner', 'active': True},
-            {'source': '49241257', 'target': '77889900', 'type': 'dodavatel', 'active': True},
-            {'source': '26267063', 'target': '99001122', 'type': 'investor', 'active': True},
-            {'source': '33344455', 'target': '49241257', 'type': 'bývalý dodavatel', 'active': False},
-
-            # =============================================
-            # OSTRAVA REGIONAL CLUSTER
-            # =============================================
-            # Directors & board members
-            {'source': 'RC005', 'target': '27082440', 'type': 'jednatel', 'active': True},
-            {'source': 'RC010', 'target': '26830311', 'type': 'člen představenstva', 'active': True},
-            {'source': 'RC014', 'target': '77889900', 'type': 'člen představenstva', 'active': True},
-            {'source': 'RC023', 'target': '27082440', 'type': 'člen dozorčí rady', 'active': True},
-            # Regional connections
-            {'source': '27082440', 'target': '26830311', 'type': 'obchodní partner', 'active': True},
-            {'source': '77889900', 'target': '26830311', 'type': 'odběratel', 'active': True},
-            {'source': '47675829', 'target': '77889900', 'type': 'sponzor', 'active': True},
-            {'source': '48173355', 'target': '27082440', 'type': 'investor', 'active': True},
-            {'source': '15890520', 'target': '27082440', 'type': 'bývalý dodavatel', 'active': False},
-
-            # =============================================
-            # TELECOM / MEDIA CLUSTER
-            # =============================================
-            {'source': 'RC003', 'target': '24287903', 'type': 'člen dozorčí rady', 'active': True},
-            {'source': 'RC008', 'target': '26505398', 'type': 'člen představenstva', 'active': True},
-            {'source': '24287903', 'target': '26505398', 'type': 'obchodní partner', 'active': True},
-            {'source': '24287903', 'target': '45534306', 'type': 'strategický partner', 'active': True},
-            {'source': '26168685', 'target': '24287903', 'type': 'dodavatel', 'active': True},
-            {'source': '26493241', 'target': '24287903', 'type': 'reklamní partner', 'active': True},
-
-            # =============================================
-            # PHARMA / HEALTH CLUSTER
-            # =============================================
-            {'source': 'RC012', 'target': '26178559', 'type': 'člen dozorčí rady', 'active': True},
-            {'source': 'RC016', 'target': '25671651', 'type': 'jednatelka', 'active': True},
-            {'source': '26178559', 'target': '25671651', 'type': 'dodavatel', 'active': True},
-            {'source': 'DE001', 'target': '26178559', 'type': 'akcionář', 'active': True},
-
-            # =============================================
-            # LOGISTICS CLUSTER
-            # =============================================
-            {'source': 'RC001', 'target': '11223300', 'type': 'jednatel', 'active': True},
-            {'source': '11223300', 'target': '28434498', 'type': 'obchodní partner', 'active': True},
-            {'source': 'DE003', 'target': '11223300', 'type': 'strategický partner', 'active': True},
-            {'source': 'DE003', 'target': '28434498', 'type': 'obchodní partner', 'active': True},
-            {'source': '11223300', 'target': '45534306', 'type': 'dodavatel', 'active': True},
-
-            # =============================================
-            # AGRICULTURE / MINING / REGIONAL
-            # =============================================
-            {'source': 'RC016', 'target': '22334400', 'type': 'člen dozorčí rady', 'active': True},
-            {'source': 'RC021', 'target': '33445500', 'type': 'jednatel', 'active': True},
-            {'source': '22334400', 'target': '25612093', 'type': 'dodavatel', 'active': True},
-            {'source': 'RC010', 'target': '25352555', 'type': 'člen dozorčí rady', 'active': True},
-            {'source': 'RC007', 'target': '99001122', 'type': 'člen představenstva', 'active': True},
-
-            # =============================================
-            # STATE ENTERPRISE
-            # =============================================
-            {'source': 'RC004', 'target': '00000795', 'type': 'člen dozorčí rady', 'active': True},
-            {'source': '00000795', 'target': '00001834', 'type': 'klient', 'active': True},
-            {'source': '00000795', 'target': '00025593', 'type': 'klient', 'active': True},
-
-            # =============================================
-            # INSOLVENT CONNECTIONS (former relationships)
-            # =============================================
-            # Bankrot Trading network
-            {'source': '12345678', 'target': 'RC001', 'type': 'bývalý jednatel', 'active': False},
-            {'source': '12345678', 'target': '87654321', 'type': 'společník', 'active': False},
-            {'source': 'CY001', 'target': '12345678', 'type': 'hidden owner', 'active': False},
-            {'source': '12345678', 'target': '55667788', 'type': 'bývalý dodavatel', 'active': False},
-            # Dlužník Investments network
-            {'source': '87654321', 'target': '27116158', 'type': 'bývalý dodavatel', 'active': False},
-            {'source': '87654321', 'target': '63998505', 'type': 'věřitel', 'active': True},
-            {'source': 'RC002', 'target': '12345678', 'type': 'bývalý jednatel', 'active': False},
-            {'source': 'RC002', 'target': '87654321', 'type': 'likvidátor', 'active': True},
-            # Firma v insolvenci network
-            {'source': '15890520', 'target': '25649329', 'type': 'bývalý dodavatel', 'active': False},
-            {'source': '15890520', 'target': '48173355', 'type': 'bývalý dodavatel', 'active': False},
-            {'source': 'RC010', 'target': '15890520', 'type': 'bývalý jednatel', 'active': False},
-            # Zkrachovalá stavební network
-            {'source': '33344455', 'target': '55667788', 'type': 'bývalý subdodavatel', 'active': False},
-            {'source': '33344455', 'target': '66778899', 'type': 'bývalý subdodavatel', 'active': False},
-            {'source': 'RC019', 'target': '33344455', 'type': 'bývalý jednatel', 'active': False},
-            # Dluh Reality network
-            {'source': '44556677', 'target': '66778899', 'type': 'bývalý partner', 'active': False},
-            {'source': '44556677', 'target': '87654321', 'type': 'propojená osoba', 'active': False},
-            {'source': 'RC007', 'target': '44556677', 'type': 'bývalý jednatel', 'active': False},
-            {'source': '44556677', 'target': '00023272', 'type': 'dlužník', 'active': True},
-
-            # =============================================
-            # CROSS-BORDER / OFFSHORE CHAINS
-            # =============================================
-            # NL → CY → CZ offshore chains (already partially defined above)
-            {'source': 'NL002', 'target': 'CY001', 'type': 'mateřská společnost', 'active': True},
-            {'source': 'RC003', 'target': 'CY001', 'type': 'director', 'active': True},
-            {'source': 'RC002', 'target': 'CY002', 'type': 'beneficial owner', 'active': True},
-            # DE connections
-            {'source': 'DE001', 'target': '48173355', 'type': 'investor', 'active': True},
-            {'source': 'DE002', 'target': 'DE001', 'type': 'sesterská společnost', 'active': True},
-            {'source': 'DE001', 'target': 'DE003', 'type': 'sesterská společnost', 'active': True},
-            # SK connections
-            {'source': 'SK001', 'target': 'SK002', 'type': 'obchodní partner', 'active': True},
-            {'source': 'SK003', 'target': 'SK001', 'type': 'obchodní partner', 'active': True},
-            {'source': 'NL004', 'target': '29307880', 'type': 'investor', 'active': True},
-            # Export partnerships
-            {'source': '60193336', 'target': 'NL001', 'type': 'export partner', 'active': True},
-            {'source': '45193509', 'target': 'DE003', 'type': 'export partner', 'active': True},
-
-            # =============================================
-            # HUB PERSONS - additional cross-sector links
-            # =============================================
-            # Karel Dvořák (RC004) - oligarch / super-connector
-            {'source': 'RC004', 'target': '60197901', 'type': 'člen dozorčí rady', 'active': True},
-            {'source': 'RC004', 'target': '45534306', 'type': 'člen dozorčí rady', 'active': True},
-            # Eva Černá (RC006) - cross-sector
-            {'source': 'RC006', 'target': '49241257', 'type': 'člen dozorčí rady', 'active': True},
-            # Martin Horák (RC009) - Plzeň + Budvar
-            {'source': 'RC009', 'target': '60193531', 'type': 'člen dozorčí rady', 'active': True},
-            # Andrea Sedláčková (RC014) - Ostrava energy + beverage
-            {'source': 'RC014', 'target': '25612093', 'type': 'člen dozorčí rady', 'active': True},
-            # Ondřej Marek (RC011) - finance + VC
-            {'source': 'RC003', 'target': '26168685', 'type': 'investorka', 'active': True},
-            # Markéta Benešová (RC022) - tech + finance
-            {'source': 'RC022', 'target': '28195078', 'type': 'člen dozorčí rady', 'active': True},
-            # Stanislav Růžička (RC025) - energy + tech
-            {'source': 'RC025', 'target': '60197901', 'type': 'prokurista', 'active': True},
-            # RC002 former consultant
-            {'source': 'RC002', 'target': '25612093', 'type': 'consultant', 'active': False},
+            {'source': source, 'target': target, 'type': rel_type, 'active': active}
+            for source, target, rel_type, active in _SAMPLE_RELATIONSHIPS
         ]
 
         print(f"[SUCCESS] Loaded {len(companies)} companies with {len(relationships)} relationships")
@@ -1228,4 +1077,478 @@ class ORJusticeParser:
             'relationships': relationships
         }
 
+
+# Synthetic fallback dataset (ORJusticeParser._get_synthetic_data)
+# 107 entities: 65 Czech companies, 25 persons, 17 foreign companies
+# Format: (ico, name, city, insolvent, country, entity type)
+_SAMPLE_ENTITIES = (
+    # ========== CZECH COMPANIES (65) ==========
+    # --- Tech / Internet (12) ---
+    ("45274649", "Avast Software s.r.o.", "Praha", False, "CZ", "company"),
+    ("27116158", "Mall Group a.s.", "Praha", False, "CZ", "company"),
+    ("63998505", "Alza.cz a.s.", "Praha", False, "CZ", "company"),
+    ("26168685", "Rohlík.cz s.r.o.", "Praha", False, "CZ", "company"),
+    ("26493241", "Seznam.cz, a.s.", "Praha", False, "CZ", "company"),
+    ("29148928", "Socialbakers a.s.", "Praha", False, "CZ", "company"),
+    ("28169522", "JetBrains s.r.o.", "Praha", False, "CZ", "company"),
+    ("24675539", "Kentico Software s.r.o.", "Brno", False, "CZ", "company"),
+    ("29307880", "Y Soft Corporation a.s.", "Brno", False, "CZ", "company"),
+    ("26441381", "GoodData s.r.o.", "Praha", False, "CZ", "company"),
+    ("05765251", "Productboard s.r.o.", "Praha", False, "CZ", "company"),
+    ("28434498", "Zásilkovna s.r.o.", "Praha", False, "CZ", "company"),
+    # --- Finance / Banking (5) ---
+    ("00025593", "Československá obchodní banka, a. s.", "Praha", False, "CZ", "company"),
+    ("00001834", "Česká spořitelna, a.s.", "Praha", False, "CZ", "company"),
+    ("00023272", "Komerční banka, a.s.", "Praha", False, "CZ", "company"),
+    ("00003468", "Česká pojišťovna a.s.", "Praha", False, "CZ", "company"),
+    ("26177005", "Home Credit a.s.", "Brno", False, "CZ", "company"),
+    # --- Telecom (1) ---
+    ("24287903", "O2 Czech Republic a.s.", "Praha", False, "CZ", "company"),
+    # --- Energy (6) ---
+    ("60197901", "ČEZ, a.s.", "Praha", False, "CZ", "company"),
+    ("25788001", "Energo-Pro a.s.", "Praha", False, "CZ", "company"),
+    ("26840065", "EPH a.s.", "Praha", False, "CZ", "company"),
+    ("25312782", "ČEZ Distribuce, a.s.", "Děčín", False, "CZ", "company"),
+    ("26418814", "Net4Gas s.r.o.", "Praha", False, "CZ", "company"),
+    ("88990011", "Severomoravská energetika s.r.o.", "Ostrava", False, "CZ", "company"),
+    # --- Manufacturing / Heavy Industry (13) ---
+    ("45534306", "Škoda Auto a.s.", "Mladá Boleslav", False, "CZ", "company"),
+    ("60193336", "Pilsner Urquell a.s.", "Plzeň", False, "CZ", "company"),
+    ("25612093", "Kofola ČeskoSlovensko a.s.", "Ostrava", False, "CZ", "company"),
+    ("60193468", "Plzeňský Prazdroj, a.s.", "Plzeň", False, "CZ", "company"),
+    ("60193531", "Budějovický Budvar, n.p.", "České Budějovice", False, "CZ", "company"),
+    ("63078333", "Moravia Steel a.s.", "Třinec", False, "CZ", "company"),
+    ("47675829", "ArcelorMittal Ostrava a.s.", "Ostrava", False, "CZ", "company"),
+    ("48173355", "Vítkovice Holding a.s.", "Ostrava", False, "CZ", "company"),
+    ("25860011", "Tatra Trucks a.s.", "Kopřivnice", False, "CZ", "company"),
+    ("47150904", "TŘINECKÉ ŽELEZÁRNY, a.s.", "Třinec", False, "CZ", "company"),
+    ("45193509", "LINET spol. s r.o.", "Slaný", False, "CZ", "company"),
+    ("25649329", "Moravská ocelárna s.r.o.", "Ostrava", False, "CZ", "company"),
+    ("44556600", "Liberecký textil a.s.", "Liberec", False, "CZ", "company"),
+    # --- Investment / Holdings (5) ---
+    ("49240480", "Agrofert, a.s.", "Praha", False, "CZ", "company"),
+    ("63480174", "Penta Investments s.r.o.", "Praha", False, "CZ", "company"),
+    ("28185480", "Rockaway Capital s.r.o.", "Praha", False, "CZ", "company"),
+    ("28195078", "Avast Holding a.s.", "Praha", False, "CZ", "company"),
+    ("25302914", "CZEC Holdings s.r.o.", "Praha", False, "CZ", "company"),
+    # --- Construction / Real Estate (5) ---
+    ("49241257", "Metrostav a.s.", "Praha", False, "CZ", "company"),
+    ("26267063", "CTP Invest s.r.o.", "Humpolec", False, "CZ", "company"),
+    ("55667788", "Reality Invest Praha s.r.o.", "Praha", False, "CZ", "company"),
+    ("66778899", "Reality Invest Brno s.r.o.", "Brno", False, "CZ", "company"),
+    ("60108088", "Komerční reality s.r.o.", "Praha", False, "CZ", "company"),
+    # --- Ostrava Regional (3) ---
+    ("27082440", "Ostrava Property Development s.r.o.", "Ostrava", False, "CZ", "company"),
+    ("26830311", "Ostravské vodárny a kanalizace a.s.", "Ostrava", False, "CZ", "company"),
+    ("77889900", "Dopravní podnik Ostrava a.s.", "Ostrava", False, "CZ", "company"),
+    # --- Pharma / Health (2) ---
+    ("26178559", "Zentiva Group a.s.", "Praha", False, "CZ", "company"),
+    ("25671651", "Novaservis a.s.", "Brno", False, "CZ", "company"),
+    # --- Media / Logistics (2) ---
+    ("26505398", "Prima TV a.s.", "Praha", False, "CZ", "company"),
+    ("11223300", "Prague Logistics s.r.o.", "Praha", False, "CZ", "company"),
+    # --- Agriculture / Mining / Regional (5) ---
+    ("22334400", "Moravský zemědělský fond a.s.", "Olomouc", False, "CZ", "company"),
+    ("33445500", "Jihočeské doly a.s.", "České Budějovice", False, "CZ", "company"),
+    ("99001122", "Technologický park Brno a.s.", "Brno", False, "CZ", "company"),
+    ("25352555", "OKD, a.s.", "Ostrava", False, "CZ", "company"),
+    ("66001122", "Liberecké sklárny a.s.", "Liberec", False, "CZ", "company"),
+    # --- State Enterprise (1) ---
+    ("00000795", "Státní tiskárna cenin, s.p.", "Praha", False, "CZ", "company"),
+    # --- Insolvent Companies (5) ---
+    ("12345678", "Bankrot Trading s.r.o.", "Praha", True, "CZ", "company"),
+    ("87654321", "Dlužník Investments a.s.", "Brno", True, "CZ", "company"),
+    ("15890520", "Firma v insolvenci s.r.o.", "Ostrava", True, "CZ", "company"),
+    ("33344455", "Zkrachovalá stavební a.s.", "Praha", True, "CZ", "company"),
+    ("44556677", "Dluh Reality s.r.o.", "Brno", True, "CZ", "company"),
+
+    # ========== PERSONS (25) ==========
+    ("RC001", "Jan Novák", "Praha", False, "CZ", "person"),
+    ("RC002", "Petr Svoboda", "Brno", False, "CZ", "person"),
+    ("RC003", "Marie Nováková", "Praha", False, "CZ", "person"),
+    ("RC004", "Karel Dvořák", "Praha", False, "CZ", "person"),
+    ("RC005", "Tomáš Procházka", "Ostrava", False, "CZ", "person"),
+    ("RC006", "Eva Černá", "Praha", False, "CZ", "person"),
+    ("RC007", "Jiří Veselý", "Brno", False, "CZ", "person"),
+    ("RC008", "Lucie Krejčová", "Praha", False, "CZ", "person"),
+    ("RC009", "Martin Horák", "Plzeň", False, "CZ", "person"),
+    ("RC010", "Barbora Němcová", "Ostrava", False, "CZ", "person"),
+    ("RC011", "Ondřej Marek", "Praha", False, "CZ", "person"),
+    ("RC012", "Zuzana Pospíšilová", "Brno", False, "CZ", "person"),
+    ("RC013", "David Král", "Praha", False, "CZ", "person"),
+    ("RC014", "Andrea Sedláčková", "Ostrava", False, "CZ", "person"),
+    ("RC015", "Filip Holub", "Praha", False, "CZ", "person"),
+    ("RC016", "Tereza Vlčková", "Olomouc", False, "CZ", "person"),
+    ("RC017", "Radek Bartoš", "Praha", False, "CZ", "person"),
+    ("RC018", "Jana Říhová", "Liberec", False, "CZ", "person"),
+    ("RC019", "Michal Šťastný", "Praha", False, "CZ", "person"),
+    ("RC020", "Petra Urbanová", "Brno", False, "CZ", "person"),
+    ("RC021", "Lukáš Fiala", "České Budějovice", False, "CZ", "person"),
+    ("RC022", "Markéta Benešová", "Praha", False, "CZ", "person"),
+    ("RC023", "Vojtěch Kopecký", "Ostrava", False, "CZ", "person"),
+    ("RC024", "Daniela Marková", "Plzeň", False, "CZ", "person"),
+    ("RC025", "Stanislav Růžička", "Praha", False, "CZ", "person"),
+
+    # ========== FOREIGN COMPANIES (17) ==========
+    # --- Cyprus (4) ---
+    ("CY001", "Cyprus Holdings Ltd.", "Nicosia", False, "CY", "company"),
+    ("CY002", "Offshore Investments Ltd.", "Limassol", False, "CY", "company"),
+    ("CY003", "Lemesos Trading Ltd.", "Limassol", False, "CY", "company"),
+    ("CY004", "Eurogate Holdings Ltd.", "Nicosia", False, "CY", "company"),
+    # --- Netherlands (4) ---
+    ("NL001", "Amsterdam Ventures B.V.", "Amsterdam", False, "NL", "company"),
+    ("NL002", "Rotterdam Holdings N.V.", "Rotterdam", False, "NL", "company"),
+    ("NL003", "Dutch Capital Management B.V.", "Amsterdam", False, "NL", "company"),
+    ("NL004", "Eindhoven Tech Invest B.V.", "Eindhoven", False, "NL", "company"),
+    # --- Slovakia (3) ---
+    ("SK001", "Bratislava Holdings a.s.", "Bratislava", False, "SK", "company"),
+    ("SK002", "Košice Industrial s.r.o.", "Košice", False, "SK", "company"),
+    ("SK003", "Žilina Energo s.r.o.", "Žilina", False, "SK", "company"),
+    # --- Germany (3) ---
+    ("DE001", "München Beteiligungen GmbH", "München", False, "DE", "company"),
+    ("DE002", "Berlin Automotive AG", "Berlin", False, "DE", "company"),
+    ("DE003", "Hamburg Logistik GmbH", "Hamburg", False, "DE", "company"),
+    # --- Luxembourg (2) ---
+    ("LU001", "Luxembourg Finance S.A.", "Luxembourg", False, "LU", "company"),
+    ("LU002", "Grand Duchy Capital S.à r.l.", "Luxembourg", False, "LU", "company"),
+    # --- UK (1) ---
+    ("UK001", "London Equity Partners LLP", "London", False, "UK", "company"),
+)
+
+@functools.lru_cache(maxsize=None)
+def _sample_companies() -> Tuple[Dict, ...]:
+    """Entity dicts of _SAMPLE_ENTITIES, built on first use; callers copy them.
+
+    Not built at import: parse worker processes never need them, and with
+    gunicorn --preload the app loads them in the master before forking.
+    """
+    return tuple(
+        {
+            'id': ico,
+            'name': name,
+            'type': entity_type,
+            'city': city,
+            'insolvent': insolvent,
+            'country': country
+        }
+        for ico, name, city, insolvent, country, entity_type in _SAMPLE_ENTITIES
+    )
+
+# ~220 relationships modeling realistic Czech corporate structures
+# Patterns: holding structures, shared directors, offshore ownership chains,
+# supply chains, financial connections, insolvency networks
+# Format: (source, target, type, active)
+_SAMPLE_RELATIONSHIPS = (
+    # =============================================
+    # TECH / INTERNET CLUSTER
+    # =============================================
+    # Directors & board members
+    ('RC001', '45274649', 'jednatel', True),
+    ('RC001', '28195078', 'člen představenstva', True),
+    ('RC006', '27116158', 'jednatelka', True),
+    ('RC008', '63998505', 'jednatelka', True),
+    ('RC002', '63998505', 'člen dozorčí rady', True),
+    ('RC011', '26168685', 'jednatel', True),
+    ('RC013', '26493241', 'jednatel', True),
+    ('RC015', '29148928', 'jednatel', True),
+    ('RC019', '28169522', 'jednatel', True),
+    ('RC007', '24675539', 'jednatel', True),
+    ('RC012', '29307880', 'jednatelka', True),
+    ('RC022', '26441381', 'jednatelka', True),
+    ('RC025', '05765251', 'jednatel', True),
+    ('RC003', '28434498', 'jednatelka', True),
+    # Ownership & investment in tech
+    ('28195078', '45274649', 'mateřská společnost', True),
+    ('28185480', '27116158', 'investor', True),
+    ('28185480', '26168685', 'investor', True),
+    ('28185480', '28434498', 'investor', True),
+    ('NL004', '26493241', 'akcionář', True),
+    ('CY001', '45274649', 'akcionář', True),
+    ('UK001', '29148928', 'investor', True),
+    ('NL001', '05765251', 'investor', True),
+    ('45274649', '27116158', 'společník', True),
+    ('27116158', '63998505', 'investor', True),
+    ('63998505', '26168685', 'obchodní partner', True),
+    ('26441381', '29148928', 'strategický partner', True),
+    ('05765251', '26441381', 'obchodní partner', True),
+    ('99001122', '24675539', 'inkubátor', True),
+    ('99001122', '29307880', 'inkubátor', True),
+    ('28434498', '63998505', 'dodavatel', True),
+
+    # =============================================
+    # FINANCE / BANKING CLUSTER
+    # =============================================
+    # Directors & board members
+    ('RC004', '00025593', 'člen představenstva', True),
+    ('RC004', '00001834', 'člen dozorčí rady', True),
+    ('RC011', '00023272', 'člen představenstva', True),
+    ('RC006', '00003468', 'člen dozorčí rady', True),
+    ('RC020', '26177005', 'jednatelka', True),
+    ('RC022', '00001834', 'člen představenstva', True),
+    ('RC011', '00003468', 'člen dozorčí rady', True),
+    # Financial relationships
+    ('NL001', '00001834', 'akcionář', True),
+    ('00025593', 'NL002', 'dceřiná společnost', True),
+    ('00001834', '00025593', 'mezibankovní partner', True),
+    ('00023272', '00003468', 'pojistný partner', True),
+    ('LU001', '00025593', 'akcionář', True),
+    ('LU001', '00023272', 'akcionář', True),
+    ('LU002', 'LU001', 'mateřská společnost', True),
+    ('26177005', 'SK001', 'dceřiná společnost', True),
+    ('RC001', '00001834', 'akcionář', True),
+    # Bank-client relationships
+    ('00001834', '55667788', 'věřitel', True),
+    ('00023272', '66778899', 'věřitel', True),
+    ('00025593', '49241257', 'věřitel', True),
+    ('45534306', '00001834', 'klient', True),
+
+    # =============================================
+    # ENERGY CLUSTER
+    # =============================================
+    # Directors & board members
+    ('RC017', '60197901', 'člen představenstva', True),
+    ('RC017', '26840065', 'předseda představenstva', True),
+    ('RC017', '25312782', 'člen dozorčí rady', True),
+    ('RC025', '25788001', 'jednatel', True),
+    ('RC013', '26418814', 'jednatel', True),
+    ('RC014', '88990011', 'jednatelka', True),
+    # Corporate structure
+    ('60197901', '25312782', 'mateřská společnost', True),
+    ('26840065', '25788001', 'dceřiná společnost', True),
+    ('26840065', '26418814', 'dceřiná společnost', True),
+    ('26840065', '88990011', 'dceřiná společnost', True),
+    ('DE001', '26840065', 'akcionář', True),
+    ('CY003', '26840065', 'akcionář', True),
+    ('NL003', 'CY003', 'mateřská společnost', True),
+    ('SK003', '88990011', 'dodavatel', True),
+    # Energy supply to industry
+    ('60197901', '45534306', 'dodavatel', True),
+    ('60197901', '47675829', 'dodavatel', True),
+    ('88990011', '77889900', 'dodavatel', True),
+    ('88990011', '26830311', 'dodavatel', True),
+
+    # =============================================
+    # MANUFACTURING / HEAVY INDUSTRY CLUSTER
+    # =============================================
+    # Directors & board members
+    ('RC009', '60193336', 'člen představenstva', True),
+    ('RC009', '60193468', 'člen dozorčí rady', True),
+    ('RC024', '60193336', 'člen dozorčí rady', True),
+    ('RC005', '47675829', 'člen představenstva', True),
+    ('RC005', '48173355', 'předseda představenstva', True),
+    ('RC005', '63078333', 'člen dozorčí rady', True),
+    ('RC023', '25649329', 'jednatel', True),
+    ('RC023', '47150904', 'člen představenstva', True),
+    ('RC010', '25860011', 'člen dozorčí rady', True),
+    ('RC021', '60193531', 'člen představenstva', True),
+    ('RC018', '44556600', 'jednatelka', True),
+    ('RC024', '45193509', 'jednatelka', True),
+    # Automotive supply chain
+    ('DE002', '45534306', 'akcionář', True),
+    ('45534306', '25860011', 'odběratel', True),
+    ('DE002', '25860011', 'strategický partner', True),
+    ('45534306', '25312782', 'odběratel', True),
+    # Steel / mining supply chain
+    ('47675829', '63078333', 'dodavatel', True),
+    ('63078333', '47150904', 'dodavatel', True),
+    ('47150904', '25649329', 'dodavatel', True),
+    ('48173355', '47675829', 'strategický partner', True),
+    ('25352555', '47675829', 'dodavatel', True),
+    ('25352555', '48173355', 'dodavatel', True),
+    ('SK002', '63078333', 'obchodní partner', True),
+    ('SK002', '47150904', 'dodavatel', True),
+    ('33445500', '47675829', 'dodavatel', True),
+    # Beer & beverage connections
+    ('60193336', '60193468', 'sesterská společnost', True),
+    ('25612093', '60193336', 'konkurent', True),
+    ('60193531', '60193336', 'konkurent', True),
+    ('25612093', 'SK001', 'dceřiná společnost', True),
+    ('60193336', '45534306', 'dodavatel', True),
+    ('NL001', '45534306', 'akcionář', True),
+    # Liberec manufacturing
+    ('44556600', '66001122', 'dodavatel', True),
+    ('44556600', '49241257', 'dodavatel', True),
+    ('RC018', '66001122', 'jednatelka', True),
+
+    # =============================================
+    # INVESTMENT / HOLDINGS CLUSTER
+    # =============================================
+    # Directors & board members
+    ('RC004', '49240480', 'předseda představenstva', True),
+    ('RC004', '63480174', 'člen představenstva', True),
+    ('RC011', '28185480', 'jednatel', True),
+    ('RC015', '25302914', 'jednatel', True),
+    ('RC019', '63480174', 'člen dozorčí rady', True),
+    # Portfolio holdings
+    ('49240480', '22334400', 'dceřiná společnost', True),
+    ('49240480', '26178559', 'akcionář', True),
+    ('49240480', '26505398', 'akcionář', True),
+    ('49240480', '60193531', 'akcionář', True),
+    ('63480174', '26177005', 'investor', True),
+    ('63480174', '00003468', 'akcionář', True),
+    ('63480174', '26178559', 'investor', True),
+    ('25302914', '55667788', 'mateřská společnost', True),
+    ('25302914', '66778899', 'mateřská společnost', True),
+    # Offshore investment chains
+    ('CY004', '63480174', 'akcionář', True),
+    ('LU002', 'CY004', 'mateřská společnost', True),
+    ('UK001', 'LU002', 'investor', True),
+    ('NL003', '49240480', 'akcionář', True),
+    ('CY002', '28185480', 'akcionář', True),
+    ('CY004', '25302914', 'investor', True),
+    ('CY002', '27116158', 'investor', True),
+
+    # =============================================
+    # CONSTRUCTION / REAL ESTATE CLUSTER
+    # =============================================
+    # Directors & board members
+    ('RC008', '49241257', 'člen představenstva', True),
+    ('RC016', '26267063', 'jednatelka', True),
+    ('RC015', '55667788', 'jednatel', True),
+    ('RC020', '66778899', 'jednatelka', True),
+    ('RC019', '60108088', 'jednatel', True),
+    # Business relationships
+    ('49241257', '26267063', 'dodavatel', True),
+    ('49241257', '55667788', 'dodavatel', True),
+    ('26267063', '66778899', 'investor', True),
+    ('55667788', '60108088', 'obchodní partner', True),
+    ('49241257', '77889900', 'dodavatel', True),
+    ('26267063', '99001122', 'investor', True),
+    ('33344455', '49241257', 'bývalý dodavatel', False),
+
+    # =============================================
+    # OSTRAVA REGIONAL CLUSTER
+    # =============================================
+    # Directors & board members
+    ('RC005', '27082440', 'jednatel', True),
+    ('RC010', '26830311', 'člen představenstva', True),
+    ('RC014', '77889900', 'člen představenstva', True),
+    ('RC023', '27082440', 'člen dozorčí rady', True),
+    # Regional connections
+    ('27082440', '26830311', 'obchodní partner', True),
+    ('77889900', '26830311', 'odběratel', True),
+    ('47675829', '77889900', 'sponzor', True),
+    ('48173355', '27082440', 'investor', True),
+    ('15890520', '27082440', 'bývalý dodavatel', False),
+
+    # =============================================
+    # TELECOM / MEDIA CLUSTER
+    # =============================================
+    ('RC003', '24287903', 'člen dozorčí rady', True),
+    ('RC008', '26505398', 'člen představenstva', True),
+    ('24287903', '26505398', 'obchodní partner', True),
+    ('24287903', '45534306', 'strategický partner', True),
+    ('26168685', '24287903', 'dodavatel', True),
+    ('26493241', '24287903', 'reklamní partner', True),
+
+    # =============================================
+    # PHARMA / HEALTH CLUSTER
+    # =============================================
+    ('RC012', '26178559', 'člen dozorčí rady', True),
+    ('RC016', '25671651', 'jednatelka', True),
+    ('26178559', '25671651', 'dodavatel', True),
+    ('DE001', '26178559', 'akcionář', True),
+
+    # =============================================
+    # LOGISTICS CLUSTER
+    # =============================================
+    ('RC001', '11223300', 'jednatel', True),
+    ('11223300', '28434498', 'obchodní partner', True),
+    ('DE003', '11223300', 'strategický partner', True),
+    ('DE003', '28434498', 'obchodní partner', True),
+    ('11223300', '45534306', 'dodavatel', True),
+
+    # =============================================
+    # AGRICULTURE / MINING / REGIONAL
+    # =============================================
+    ('RC016', '22334400', 'člen dozorčí rady', True),
+    ('RC021', '33445500', 'jednatel', True),
+    ('22334400', '25612093', 'dodavatel', True),
+    ('RC010', '25352555', 'člen dozorčí rady', True),
+    ('RC007', '99001122', 'člen představenstva', True),
+
+    # =============================================
+    # STATE ENTERPRISE
+    # =============================================
+    ('RC004', '00000795', 'člen dozorčí rady', True),
+    ('00000795', '00001834', 'klient', True),
+    ('00000795', '00025593', 'klient', True),
+
+    # =============================================
+    # INSOLVENT CONNECTIONS (former relationships)
+    # =============================================
+    # Bankrot Trading network
+    ('12345678', 'RC001', 'bývalý jednatel', False),
+    ('12345678', '87654321', 'společník', False),
+    ('CY001', '12345678', 'hidden owner', False),
+    ('12345678', '55667788', 'bývalý dodavatel', False),
+    # Dlužník Investments network
+    ('87654321', '27116158', 'bývalý dodavatel', False),
+    ('87654321', '63998505', 'věřitel', True),
+    ('RC002', '12345678', 'bývalý jednatel', False),
+    ('RC002', '87654321', 'likvidátor', True),
+    # Firma v insolvenci network
+    ('15890520', '25649329', 'bývalý dodavatel', False),
+    ('15890520', '48173355', 'bývalý dodavatel', False),
+    ('RC010', '15890520', 'bývalý jednatel', False),
+    # Zkrachovalá stavební network
+    ('33344455', '55667788', 'bývalý subdodavatel', False),
+    ('33344455', '66778899', 'bývalý subdodavatel', False),
+    ('RC019', '33344455', 'bývalý jednatel', False),
+    # Dluh Reality network
+    ('44556677', '66778899', 'bývalý partner', False),
+    ('44556677', '87654321', 'propojená osoba', False),
+    ('RC007', '44556677', 'bývalý jednatel', False),
+    ('44556677', '00023272', 'dlužník', True),
+
+    # =============================================
+    # CROSS-BORDER / OFFSHORE CHAINS
+    # =============================================
+    # NL → CY → CZ offshore chains (already partially defined above)
+    ('NL002', 'CY001', 'mateřská společnost', True),
+    ('RC003', 'CY001', 'director', True),
+    ('RC002', 'CY002', 'beneficial owner', True),
+    # DE connections
+    ('DE001', '48173355', 'investor', True),
+    ('DE002', 'DE001', 'sesterská společnost', True),
+    ('DE001', 'DE003', 'sesterská společnost', True),
+    # SK connections
+    ('SK001', 'SK002', 'obchodní partner', True),
+    ('SK003', 'SK001', 'obchodní partner', True),
+    ('NL004', '29307880', 'investor', True),
+    # Export partnerships
+    ('60193336', 'NL001', 'export partner', True),
+    ('45193509', 'DE003', 'export partner', True),
+
+    # =============================================
+    # HUB PERSONS - additional cross-sector links
+    # =============================================
+    # Karel Dvořák (RC004) - oligarch / super-connector
+    ('RC004', '60197901', 'člen dozorčí rady', True),
+    ('RC004', '45534306', 'člen dozorčí rady', True),
+    # Eva Černá (RC006) - cross-sector
+    ('RC006', '49241257', 'člen dozorčí rady', True),
+    # Martin Horák (RC009) - Plzeň + Budvar
+    ('RC009', '60193531', 'člen dozorčí rady', True),
+    # Andrea Sedláčková (RC014) - Ostrava energy + beverage
+    ('RC014', '25612093', 'člen dozorčí rady', True),
+    # Ondřej Marek (RC011) - finance + VC
+    ('RC003', '26168685', 'investorka', True),
+    # Markéta Benešová (RC022) - tech + finance
+    ('RC022', '28195078', 'člen dozorčí rady', True),
+    # Stanislav Růžička (RC025) - energy + tech
+    ('RC025', '60197901', 'prokurista', True),
+    # RC002 former consultant
+    ('RC002', '25612093', 'consultant', False),
+)
+
+# Seed integrity, checked once at import: IDs are unique and every edge
+# joins two seeded entities (real OR data may still reference unknown IDs)
+_SAMPLE_IDS = frozenset(row[0] for row in _SAMPLE_ENTITIES)
+assert len(_SAMPLE_IDS) == len(_SAMPLE_ENTITIES), "duplicate ID in _SAMPLE_ENTITIES"
+assert all(source in _SAMPLE_IDS and target in _SAMPLE_IDS
+           for source, target, _, _ in _SAMPLE_RELATIONSHIPS), "dangling edge in _SAMPLE_RELATIONSHIPS"
+del _SAMPLE_IDS
+
+
 or_parser = ORJusticeParser()
\ No newline at end of file
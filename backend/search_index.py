@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+import heapq
+import threading
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Dict, List, Optional, Set
+
+_FIELD_SEP = '\x1f'
+_NODE_SEP = '\x1e'
+
+
+class SearchIndex:
+    """Lookup tables for entity search (name, ID, city), maintained on insert"""
+
+    def __init__(self):
+        self._refresh_lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        """Drop all indexed entities"""
+        self.name_lower: Dict[str, str] = {}
+        self.city_lower: Dict[str, str] = {}
+        self.id_lower: Dict[str, str] = {}
+        # Name, ID and city joined by _FIELD_SEP: one substring test per candidate
+        self._haystack: Dict[str, str] = {}
+        # node_id -> insertion order (tie-breaker for equal names)
+        self._order: Dict[str, int] = {}
+        # Character trigram -> IDs of nodes with that trigram in name, ID or city
+        self._trigrams: Dict[str, Set[str]] = defaultdict(set)
+        # (name_lower, insertion order, node_id) sorted by name - a flat
+        # replacement for a prefix trie: a prefix is a contiguous slice
+        self._sorted_names: List[tuple] = []
+        # All name/ID/city strings joined into one corpus so a short substring
+        # query is a few str.find calls; _offsets[i] is where node i's segment starts
+        self._node_order: List[str] = []
+        self._corpus = ''
+        self._offsets: List[int] = []
+        # Sorted names and corpus are rebuilt lazily after inserts
+        self._dirty = False
+
+    def add(self, node_id: str, name: str = '', city: str = ''):
+        """Index one node, replacing its previous entry if it was already indexed"""
+        if node_id in self._order:
+            for trigram in self._node_trigrams(node_id):
+                self._trigrams[trigram].discard(node_id)
+        else:
+            self._order[node_id] = len(self._order)
+
+        self.name_lower[node_id] = str(name).lower()
+        self.city_lower[node_id] = str(city).lower()
+        self.id_lower[node_id] = str(node_id).lower()
+        self._haystack[node_id] = _FIELD_SEP.join((self.name_lower[node_id], self.id_lower[node_id],
+                                                   self.city_lower[node_id]))
+
+        for trigram in self._node_trigrams(node_id):
+            self._trigrams[trigram].add(node_id)
+        self._dirty = True
+
+    def rebuild(self, graph):
+        """Index every node of a NetworkX graph from scratch"""
+        self.clear()
+        for node_id, node_data in graph.nodes(data=True):
+            self.add(node_id, node_data.get('name', ''), node_data.get('city', ''))
+
+    def _node_trigrams(self, node_id: str) -> Set[str]:
+        """Trigrams of a node's indexed fields (never spanning two fields)"""
+        trigrams = set()
+        for text in (self.name_lower[node_id], self.id_lower[node_id], self.city_lower[node_id]):
+            trigrams.update(text[i:i + 3] for i in range(len(text) - 2))
+        return trigrams
+
+    def _refresh(self):
+        """Rebuild the sorted name list and the substring corpus after inserts"""
+        if not self._dirty:
+            return
+        with self._refresh_lock:
+            if not self._dirty:
+                return
+
+            node_order = list(self.name_lower)
+            sorted_names = sorted(
+                (self.name_lower[node_id], order, node_id)
+                for order, node_id in enumerate(node_order)
+            )
+
+            segments = []
+            offsets = []
+            offset = 0
+            for node_id in node_order:
+                segment = self._haystack[node_id] + _NODE_SEP
+                segments.append(segment)
+                offsets.append(offset)
+                offset += len(segment)
+
+            self._sorted_names = sorted_names
+            self._node_order = node_order
+            self._corpus = ''.join(segments)
+            self._offsets = offsets
+            self._dirty = False
+
+    def substring_matches(self, query: str) -> List[int]:
+        """Insertion-order positions of nodes whose name, ID or city contains query"""
+        self._refresh()
+        if _FIELD_SEP in query or _NODE_SEP in query:
+            return []
+
+        if len(query) >= 3:
+            return self._trigram_matches(query)
+
+        # Too short for trigrams: scan the joined corpus
+        corpus = self._corpus
+        offsets = self._offsets
+        matches = []
+        pos = corpus.find(query)
+        while pos != -1:
+            order = bisect_right(offsets, pos) - 1
+            matches.append(order)
+            # Skip the rest of this node's segment
+            if order + 1 >= len(offsets):
+                break
+            pos = corpus.find(query, offsets[order + 1])
+        return matches
+
+    def _trigram_matches(self, query: str) -> List[int]:
+        """Intersect the query's trigram posting lists, then verify each candidate"""
+        postings = []
+        for trigram in {query[i:i + 3] for i in range(len(query) - 2)}:
+            posting = self._trigrams.get(trigram)
+            if not posting:
+                return []
+            postings.append(posting)
+
+        # Start from the rarest trigram so the working set stays small
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                return []
+
+        haystack = self._haystack
+        return sorted(self._order[node_id] for node_id in candidates if query in haystack[node_id])
+
+    def prefix_matches(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """Node IDs whose lowercased name starts with query, ordered by name"""
+        self._refresh()
+        entries = self._sorted_names
+        start = bisect_left(entries, (query,))
+        stop = len(entries) if limit is None else min(len(entries), start + limit)
+        matches = []
+        for i in range(start, stop):
+            name, _, node_id = entries[i]
+            if not name.startswith(query):
+                break
+            matches.append(node_id)
+        return matches
+
+    def search(self, query: str, limit: int = 20) -> List[str]:
+        """Return up to `limit` node IDs matching a lowercased query.
+
+        Ordering matches the original endpoint: names starting with the query
+        first, then everything else by name.
+        """
+        results = self.prefix_matches(query, limit)
+        if len(results) >= limit:
+            return results
+
+        # Fall back to a substring search for the remaining slots
+        prefix_hits = set(results)
+        others = []
+        for order in self.substring_matches(query):
+            node_id = self._node_order[order]
+            if node_id not in prefix_hits:
+                others.append((self.name_lower[node_id], order, node_id))
+
+        # Bounded selection instead of sorting every hit
+        best = heapq.nsmallest(limit - len(results), others)
+        results.extend(node_id for _, _, node_id in best)
+        return results
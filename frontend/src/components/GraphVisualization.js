@@ -277,12 +277,13 @@ function GraphVisualization({ graphData, onCyReady, onNodeClick }) {
         try {
           const visibleNodeIds = cy.nodes().map(n => n.id()).join(',');
 
+          // delta=1: the server only returns nodes/edges not already on screen
           const response = await axios.get(`${config.API_BASE_URL}/api/explore/${nodeId}`, {
-            params: { existing_nodes: visibleNodeIds }
+            params: { existing_nodes: visibleNodeIds, delta: 1 }
           });
 
-          const newNodes = response.data.subgraph.nodes;
-          const newEdges = response.data.subgraph.edges;
+          const newNodes = response.data.added_nodes;
+          const newEdges = response.data.added_edges;
 
           const existingNodeIds = new Set(cy.nodes().map(n => n.id()));
           const nodesToAdd = newNodes.filter(n => !existingNodeIds.has(n.data.id));
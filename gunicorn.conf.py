@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+# Picked up automatically by gunicorn from the working directory; worker
+# counts and binding stay on the command line (Procfile / render.yaml).
+import gc
+
+# Build the graph once in the master; workers share it copy-on-write
+preload_app = True
+
+
+def pre_fork(server, worker):
+    """Freeze the preloaded objects so GC passes in workers don't touch (and copy) their pages"""
+    gc.freeze()